@@ -8,12 +8,37 @@
 
 """Invenio Administration core admin module."""
 
-from flask import Blueprint
+import os
+import threading
+from collections import OrderedDict
+from functools import partial
+from types import MappingProxyType
+
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    jsonify,
+    render_template,
+    request,
+    stream_with_context,
+)
+from flask_babelex import get_locale
 from flask_menu import current_menu
+from invenio_records_resources.resources.records.args import SearchRequestArgsSchema
+from invenio_records_resources.services.errors import PermissionDeniedError
+from invenio_search.engine import search
+from markupsafe import Markup
+from marshmallow import ValidationError
 from werkzeug.utils import import_string
 
+from invenio_administration.errors import InvalidCursor
+from invenio_administration.export import EXPORT_MIMETYPES
 from invenio_administration.menu import AdminMenu
+from invenio_administration.permissions import administration_permission
 
+from .registry import ViewRegistry
+from .schemas import SchemaArtifacts, build_schema_document, schema_fingerprint
 from .views.base import AdminView
 
 
@@ -43,9 +68,22 @@ class Administration:
         super().__init__()
 
         self.app = app
-        self._views = []
-        self._menu = AdminMenu()
+        self.registry = ViewRegistry()
+        self._schema_documents = {}
+        self._static_contexts = {}
+        self._lazy_views = {}
+        self._unrestricted_lazy_views = set()
+        self._sidebar_fragments = OrderedDict()
+        self._sidebar_lock = threading.Lock()
+        self._lazy_lock = threading.RLock()
+        self.schema_artifacts = SchemaArtifacts(
+            app.config.get("ADMINISTRATION_SCHEMAS_ARTIFACTS_PATH")
+            or os.path.join(app.instance_path, "administration", "schemas"),
+            fingerprint=partial(schema_fingerprint, app.config),
+        )
+        self._menu = AdminMenu(permission_resolver=self.get_view_permission)
         self._menu_key = "admin_navigation"
+        self._menu_registered = False
         self.blueprint = None
 
         if name is None:
@@ -56,16 +94,23 @@ class Administration:
         self.endpoint = ui_endpoint or "administration"
         self.url = url or "/administration"
         self.base_template = base_template or "invenio_administration/base.html"
+        self.sidebar_template = "invenio_administration/sidebar/sidenav.html"
 
         self.create_blueprint()
+        app.add_template_global(self.registry, "administration_views")
+        app.add_template_global(self.render_sidebar, "render_administration_sidebar")
 
         if self.dashboard_view_class is not None:
             self._add_dashboard_view()
 
-        @app.before_first_request
-        def init_menu():
-            self._menu.register_menu_entries(current_menu, self._menu_key)
-            self._menu.register_admin_entry(current_menu, self.endpoint)
+    def register_menu(self):
+        """Register the admin menu entries on the flask menu, only once."""
+        if self._menu_registered:
+            return
+        self._menu.register_menu_entries(current_menu, self._menu_key)
+        self._menu.register_admin_entry(current_menu, self.endpoint)
+        self._menu_registered = True
+        self.invalidate_sidebar()
 
     def load_admin_dashboard(self, app):
         """Load dashboard view configuration."""
@@ -83,45 +128,333 @@ class Administration:
             template_folder="templates",
             static_folder="static",
         )
+        self.blueprint.add_url_rule(
+            rule="/_schemas/<view_name>",
+            endpoint="_schema",
+            view_func=administration_permission.require(http_exception=403)(
+                self.schema_view
+            ),
+        )
+        self.blueprint.add_url_rule(
+            rule="/_search/<view_name>",
+            endpoint="_search",
+            view_func=administration_permission.require(http_exception=403)(
+                self.search_view
+            ),
+        )
+        self.blueprint.add_url_rule(
+            rule="/_export/<view_name>/<export_format>",
+            endpoint="_export",
+            view_func=administration_permission.require(http_exception=403)(
+                self.export_view
+            ),
+        )
 
     @property
     def views(self):
         """Registered admin views."""
-        return self._views
+        return self.registry.views
 
     def add_view(self, view, view_instance, *args, **kwargs):
         """Add a view to admin views."""
         # Validate view's class and name's uniqueness.
         if not issubclass(view.view_class, AdminView):
             raise TypeError(f"View class must be of type {AdminView.__name__}")
-        if any(v.view_class.name == view.view_class.name for v in self.views):
-            raise ValueError(f"View name already registered: {view.view_class.name}")
-
-        self.views.append(view)
+        self._check_view_name(view.view_class.name)
+        self._bind_view(view, view_instance)
 
         self.blueprint.add_url_rule(
             rule=view_instance.url,
             view_func=view,
         )
 
+        if self.has_menu_entry(view_instance):
+            self._menu.add_view_to_menu(view_instance)
+            self.invalidate_sidebar()
+
+    @staticmethod
+    def has_menu_entry(view_instance):
+        """Whether a view is listed in the admin menu."""
         from invenio_administration.views.base import (
             AdminFormView,
             AdminResourceDetailView,
         )
 
-        if not isinstance(view_instance, AdminResourceDetailView) and not isinstance(
-                view_instance, AdminFormView):
-            self._menu.add_view_to_menu(view_instance)
+        return not isinstance(view_instance, (AdminResourceDetailView, AdminFormView))
+
+    def _check_view_name(self, name):
+        """Validate the uniqueness of a view name."""
+        if name in self._lazy_views or name in self.registry:
+            raise ValueError(f"View name already registered: {name}")
+
+    def _bind_view(self, view, view_instance):
+        self.registry.add(view, view_instance)
+        # compile the view's permissions ahead of requests
+        view.view_class.get_permission()
+
+    def add_lazy_view(self, lazy_view, loader):
+        """Add a view without importing it.
+
+        The URL rule and the menu entry are registered from the view's
+        metadata, the view itself is loaded when first dispatched or looked
+        up.
+
+        :param lazy_view: :class:`invenio_administration.lazy.LazyView`.
+        :param loader: callable importing the view, returning its view
+            function and instance.
+        """
+        name = lazy_view.name
+        self._check_view_name(name)
+        self._lazy_views[name] = loader
+        if not lazy_view.restricted:
+            self._unrestricted_lazy_views.add(name)
+
+        def dispatch_lazy_view(**kwargs):
+            return self.load_lazy_view(name)(**kwargs)
+
+        self.blueprint.add_url_rule(
+            rule=lazy_view.url,
+            endpoint=name,
+            view_func=dispatch_lazy_view,
+            methods=lazy_view.methods,
+        )
+        if lazy_view.in_menu:
+            self._menu.add_view_to_menu(lazy_view)
+            self.invalidate_sidebar()
+
+    def load_lazy_view(self, name):
+        """Load a lazily added view, returning its view function."""
+        endpoint = f"{self.endpoint}.{name}"
+        with self._lazy_lock:
+            loader = self._lazy_views.get(name)
+            if loader is not None:
+                view, view_instance = loader()
+                self._bind_view(view, view_instance)
+                # later requests are dispatched to the view directly
+                self.app.view_functions[endpoint] = view
+                del self._lazy_views[name]
+        return self.app.view_functions[endpoint]
+
+    def load_lazy_views(self):
+        """Load all the lazily added views."""
+        for name in list(self._lazy_views):
+            self.load_lazy_view(name)
 
     def _add_dashboard_view(self):
         """Add the admin dashboard view."""
         dashboard_instance = self.dashboard_view_class(
             admin=self, extension_name="invenio-administration"
         )
-        dashboard_view = self.dashboard_view_class.as_view(
-            self.dashboard_view_class.name,
-            admin=self,
-            extension_name="invenio-administration",
-        )
+        if self.app.config["ADMINISTRATION_SHARED_VIEWS"]:
+            dashboard_view = dashboard_instance.as_shared_view()
+        else:
+            dashboard_view = self.dashboard_view_class.as_view(
+                self.dashboard_view_class.name,
+                admin=self,
+                extension_name="invenio-administration",
+            )
 
         self.add_view(dashboard_view, dashboard_instance)
+
+    def get_view_instance(self, name):
+        """Get the registered view instance by its name."""
+        if name in self._lazy_views:
+            self.load_lazy_view(name)
+        return self.registry.get(name)
+
+    def get_view_permission(self, name):
+        """Get the permission of a view by its name, ``None`` if not restricted.
+
+        Lazily added views are loaded if restricted.
+        """
+        if name in self._unrestricted_lazy_views and name in self._lazy_views:
+            return None
+        view_instance = self.get_view_instance(name)
+        if view_instance is None:
+            return None
+        return view_instance.get_permission()
+
+    def get_schema_document(self, name):
+        """Get the serialized schema document of a resource view.
+
+        Documents are loaded once per view and locale, since field titles can
+        be lazy translated strings. Precompiled artifacts are preferred over
+        serializing the view's schemas.
+
+        :param name: name of the registered resource view.
+        :returns: a :class:`invenio_administration.schemas.SchemaDocument` or
+            ``None`` if no resource view is registered with that name.
+        """
+        locale = str(get_locale())
+        key = (name, locale)
+        document = self._schema_documents.get(key)
+        if document is None:
+            document = self.schema_artifacts.load(
+                name, locale
+            ) or self.build_schema_document(name)
+            if document is None:
+                return None
+            self._schema_documents[key] = document
+        return document
+
+    def build_schema_document(self, name):
+        """Serialize the schema document of a resource view."""
+        view_instance = self.get_view_instance(name)
+        if not hasattr(view_instance, "get_schema_payload"):
+            return None
+        return build_schema_document(view_instance.get_schema_payload())
+
+    def build_schema_documents(self):
+        """Serialize the schema documents of all registered resource views."""
+        documents = {}
+        for view_instance in self.registry:
+            name = view_instance.name
+            document = self.build_schema_document(name)
+            if document is not None:
+                documents[name] = document
+        return documents
+
+    def get_static_context(self, view_instance):
+        """Get the frozen template context shared by all requests to a view.
+
+        Contexts are built once per view and locale, as they reference the
+        view's schema document.
+        """
+        key = (view_instance.name, str(get_locale()))
+        context = self._static_contexts.get(key)
+        if context is None:
+            context = MappingProxyType(view_instance.build_static_context())
+            self._static_contexts[key] = context
+        return context
+
+    def invalidate_schema_documents(self):
+        """Drop the built schema documents and the contexts referencing them."""
+        self._schema_documents.clear()
+        self._static_contexts.clear()
+
+    def render_sidebar(self):
+        """Render the sidebar menu, cached across requests.
+
+        Fragments are cached per locale, script root, active menu items
+        (including the ones with a custom ``active_when``) and visible menu
+        items, so that identities with the same permissions share them.
+        """
+        maxsize = self.app.config["ADMINISTRATION_SIDEBAR_CACHE_MAXSIZE"]
+        if not maxsize:
+            return Markup(render_template(self.sidebar_template))
+
+        key = (
+            str(get_locale()),
+            request.script_root,
+            self._menu.get_active_endpoints(),
+            self._menu.get_custom_active_names(),
+            self._menu.get_visible_names(),
+        )
+        with self._sidebar_lock:
+            fragment = self._sidebar_fragments.get(key)
+            if fragment is not None:
+                self._sidebar_fragments.move_to_end(key)
+                return fragment
+
+        fragment = Markup(render_template(self.sidebar_template))
+        with self._sidebar_lock:
+            self._sidebar_fragments[key] = fragment
+            while len(self._sidebar_fragments) > maxsize:
+                self._sidebar_fragments.popitem(last=False)
+        return fragment
+
+    def invalidate_sidebar(self):
+        """Drop the rendered sidebar fragments, e.g. when the menu changes."""
+        with self._sidebar_lock:
+            self._sidebar_fragments.clear()
+
+    def search_view(self, view_name):
+        """Serve the results of a list view searching through the administration.
+
+        Used by views paging with cursors or filtering the source of their
+        results. Takes the query string arguments of the view's search API,
+        and the ``cursor`` of the previous page.
+        """
+        view_instance = self.get_view_instance(view_name)
+        if not (
+            getattr(view_instance, "cursor_pagination", False)
+            or getattr(view_instance, "source_filtering", False)
+        ):
+            abort(404)
+        permission = self.get_view_permission(view_name)
+        if permission is not None and not permission.can():
+            abort(403)
+
+        args = request.args.copy()
+        cursor = args.pop("cursor", None)
+        try:
+            params = self._load_search_args(view_instance, args)
+            return jsonify(view_instance.search(params, cursor))
+        except (InvalidCursor, ValidationError) as e:
+            abort(400, str(e))
+        except search.exceptions.RequestError:
+            abort(400, "Invalid query.")
+        except PermissionDeniedError:
+            abort(403)
+
+    def export_view(self, view_name, export_format):
+        """Stream the export of the results of a list view.
+
+        Takes the query string arguments of the view's search API, the
+        results of the whole search are exported.
+        """
+        view_instance = self.get_view_instance(view_name)
+        if export_format not in getattr(view_instance, "export_formats", ()):
+            abort(404)
+        permission = self.get_view_permission(view_name)
+        if permission is not None and not permission.can():
+            abort(403)
+        if not view_instance.can_perform("export"):
+            abort(403)
+
+        try:
+            params = self._load_search_args(view_instance, request.args)
+            lines = view_instance.export(params, export_format)
+        except ValidationError as e:
+            abort(400, str(e))
+        except search.exceptions.RequestError:
+            abort(400, "Invalid query.")
+        except PermissionDeniedError:
+            abort(403)
+
+        response = current_app.response_class(
+            stream_with_context(lines), mimetype=EXPORT_MIMETYPES[export_format]
+        )
+        response.headers[
+            "Content-Disposition"
+        ] = f'attachment; filename="{view_name}.{export_format}"'
+        return response
+
+    @staticmethod
+    def _load_search_args(view_instance, args):
+        """Load the search parameters of a view from query string arguments."""
+        args_schema = getattr(
+            view_instance.resource.config,
+            "request_search_args",
+            SearchRequestArgsSchema,
+        )
+        return args_schema().load(args)
+
+    def schema_view(self, view_name):
+        """Serve the schema document of a view, cacheable by content hash."""
+        document = self.get_schema_document(view_name)
+        if document is None:
+            abort(404)
+        permission = self.get_view_permission(view_name)
+        if permission is not None and not permission.can():
+            abort(403)
+
+        response = current_app.response_class(
+            document.body, mimetype="application/json"
+        )
+        response.set_etag(document.etag)
+        response.cache_control.private = True
+        response.cache_control.max_age = current_app.config[
+            "ADMINISTRATION_SCHEMA_MAX_AGE"
+        ]
+        return response.make_conditional(request)
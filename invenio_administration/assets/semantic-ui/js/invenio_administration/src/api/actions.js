@@ -9,8 +9,10 @@ const deleteResource = async (apiEndpoint) => {
   return await http.delete(apiEndpoint);
 };
 
-const editResource = async (apiEndpoint, pid, payload) => {
-  return await http.put(APIRoutes.get(apiEndpoint, pid), payload);
+const editResource = async (apiEndpoint, pid, payload, etag) => {
+  // the update is rejected if the record changed since its revision was read
+  const headers = etag ? { "If-Match": etag } : {};
+  return await http.put(APIRoutes.get(apiEndpoint, pid), payload, { headers: headers });
 };
 
 const createResource = async (apiEndpoint, payload) => {
@@ -0,0 +1,55 @@
+// This file is part of InvenioAdministration
+// Copyright (C) 2022 CERN.
+//
+// Invenio is free software; you can redistribute it and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+import axios from "axios";
+
+const parseData = (data) => (typeof data === "string" ? JSON.parse(data) : data);
+
+/**
+ * Request the search app's pages with the cursors of the previous pages.
+ *
+ * The search endpoint of views paging with cursors returns the cursor of the
+ * next page with each page. Cursors are kept per query, a page is requested
+ * with the cursor of the page before it, and the pages in between are
+ * requested first when the app jumps ahead. As for the prefetched results,
+ * the requests are handled by the axios adapter since the search app builds
+ * its own API client.
+ */
+export const paginateWithCursors = (domContainer) => {
+  const searchConfig = JSON.parse(domContainer.dataset.invenioSearchConfig);
+  const searchUrl = searchConfig.searchApi.axios.url;
+  const adapter = axios.defaults.adapter;
+  // cursors by query, the n-th one starting page n + 1
+  const cursors = {};
+
+  const requestPage = (config, cursor) => {
+    const url = cursor
+      ? `${searchUrl}?cursor=${encodeURIComponent(cursor)}`
+      : searchUrl;
+    return adapter({ ...config, url: url });
+  };
+
+  axios.defaults.adapter = async (config) => {
+    if (config.method !== "get" || config.url !== searchUrl) {
+      return adapter(config);
+    }
+    const { page = 1, ...query } = config.params || {};
+    const key = JSON.stringify(query);
+    const queryCursors = (cursors[key] = cursors[key] || [null]);
+
+    let response;
+    for (let n = Math.min(page, queryCursors.length); n <= page; n++) {
+      response = await requestPage(config, queryCursors[n - 1]);
+      const data = parseData(response.data);
+      if (n < page && !data.cursor) {
+        // the results ended before the page
+        return { ...response, data: { ...data, hits: { ...data.hits, hits: [] } } };
+      }
+      queryCursors[n] = data.cursor;
+    }
+    return response;
+  };
+};
@@ -0,0 +1,63 @@
+import axios from "axios";
+import { paginateWithCursors } from "./cursor";
+
+const container = () => {
+  const element = document.createElement("div");
+  element.dataset.invenioSearchConfig = JSON.stringify({
+    searchApi: { axios: { url: "/search" } },
+  });
+  return element;
+};
+
+// pages of two hits out of five, the cursor being the last hit
+const hits = ["a", "b", "c", "d", "e"];
+let requests;
+
+beforeEach(() => {
+  requests = [];
+  axios.defaults.adapter = jest.fn((config) => {
+    requests.push(config.url);
+    const cursor = new URL(config.url, "http://localhost").searchParams.get("cursor");
+    const start = cursor ? hits.indexOf(cursor) + 1 : 0;
+    const page = hits.slice(start, start + 2);
+    const data = { hits: { hits: page, total: hits.length } };
+    if (page.length === 2 && start + 2 < hits.length) {
+      data.cursor = page[1];
+    }
+    return Promise.resolve({ data: JSON.stringify(data), status: 200 });
+  });
+  paginateWithCursors(container());
+});
+
+const search = async (page, queryString = "") =>
+  (await axios.get("/search", { params: { queryString, page } })).data;
+
+it("requests the pages after the cursor of the previous page", async () => {
+  expect((await search(1)).hits.hits).toEqual(["a", "b"]);
+  expect((await search(2)).hits.hits).toEqual(["c", "d"]);
+  expect(requests).toEqual(["/search", "/search?cursor=b"]);
+});
+
+it("walks to pages without cursor", async () => {
+  expect((await search(3)).hits.hits).toEqual(["e"]);
+  expect(requests).toEqual(["/search", "/search?cursor=b", "/search?cursor=d"]);
+
+  // the cursors are kept
+  expect((await search(2)).hits.hits).toEqual(["c", "d"]);
+  expect(requests.length).toEqual(4);
+});
+
+it("keeps the cursors per query", async () => {
+  await search(2);
+  await search(2, "title");
+  expect(requests).toEqual([
+    "/search",
+    "/search?cursor=b",
+    "/search",
+    "/search?cursor=b",
+  ]);
+});
+
+it("returns no hits after the last page", async () => {
+  expect((await search(4)).hits.hits).toEqual([]);
+});
@@ -0,0 +1,44 @@
+// This file is part of InvenioAdministration
+// Copyright (C) 2022 CERN.
+//
+// Invenio is free software; you can redistribute it and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+import axios from "axios";
+
+/**
+ * Answer the search app's first request with the results embedded in the page.
+ *
+ * The search app builds its own API client, so the first GET request to the
+ * search endpoint is resolved by the axios adapter with the prefetched
+ * results, the following requests reach the API. Clients created with
+ * ``axios.create`` keep the adapter of their creation, hence the adapter is
+ * not restored but passes through once used. Pages with a query string start
+ * from another query and are left alone.
+ */
+export const hydrateFirstSearch = (domContainer) => {
+  const prefetched = domContainer.dataset.prefetchedSearch;
+  if (!prefetched || window.location.search) {
+    return;
+  }
+  const searchConfig = JSON.parse(domContainer.dataset.invenioSearchConfig);
+  const searchUrl = searchConfig.searchApi.axios.url;
+  const data = JSON.parse(prefetched);
+  const adapter = axios.defaults.adapter;
+  let hydrated = false;
+
+  axios.defaults.adapter = (config) => {
+    if (hydrated || config.method !== "get" || config.url !== searchUrl) {
+      return adapter(config);
+    }
+    hydrated = true;
+    return Promise.resolve({
+      data: data,
+      status: 200,
+      statusText: "OK",
+      headers: {},
+      config: config,
+      request: {},
+    });
+  };
+};
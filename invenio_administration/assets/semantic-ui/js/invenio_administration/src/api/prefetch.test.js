@@ -0,0 +1,57 @@
+import axios from "axios";
+import { hydrateFirstSearch } from "./prefetch";
+
+const results = { hits: { hits: [{ id: "1" }], total: 1 }, aggregations: {} };
+
+const container = (prefetched) => {
+  const element = document.createElement("div");
+  element.dataset.invenioSearchConfig = JSON.stringify({
+    searchApi: { axios: { url: "/api/mock" } },
+  });
+  if (prefetched) {
+    element.dataset.prefetchedSearch = JSON.stringify(prefetched);
+  }
+  return element;
+};
+
+let adapter;
+
+beforeEach(() => {
+  adapter = jest.fn(() => Promise.resolve({ data: "api", status: 200 }));
+  axios.defaults.adapter = adapter;
+});
+
+it("answers the first search request with the prefetched results", async () => {
+  hydrateFirstSearch(container(results));
+
+  const first = await axios.get("/api/mock", { params: { q: "" } });
+  expect(first.data).toEqual(results);
+  expect(adapter).not.toHaveBeenCalled();
+
+  const second = await axios.get("/api/mock", { params: { q: "" } });
+  expect(second.data).toEqual("api");
+  expect(adapter).toHaveBeenCalledTimes(1);
+});
+
+it("answers a single request of clients created beforehand", async () => {
+  hydrateFirstSearch(container(results));
+  const client = axios.create({ url: "/api/mock" });
+
+  expect((await client.request({})).data).toEqual(results);
+  expect((await client.request({})).data).toEqual("api");
+  expect((await axios.get("/api/mock")).data).toEqual("api");
+});
+
+it("leaves other requests to the API", async () => {
+  hydrateFirstSearch(container(results));
+
+  const response = await axios.get("/api/other");
+  expect(response.data).toEqual("api");
+});
+
+it("does nothing without prefetched results", async () => {
+  hydrateFirstSearch(container());
+
+  const response = await axios.get("/api/mock");
+  expect(response.data).toEqual("api");
+});
@@ -0,0 +1,111 @@
+// This file is part of InvenioAdministration
+// Copyright (C) 2022 CERN.
+//
+// Invenio is free software; you can redistribute it and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+import { http } from "react-invenio-forms";
+
+const REF_PREFIX = "#/$defs/";
+
+/**
+ * Resolve a schema serialized with references into nested properties.
+ *
+ * Each reference is expanded into its own copy of the definition. A field
+ * referencing a definition being expanded (i.e. a recursive schema) is left
+ * out, so the result is a finite tree the form and details components can
+ * walk.
+ */
+export const resolveSchemaRefs = (schema) => {
+  if (!schema || schema.$defs === undefined) {
+    return schema;
+  }
+  const definitions = schema.$defs;
+  const refName = (ref) => ref.slice(REF_PREFIX.length);
+
+  const resolveDefinition = (name, expanding) => {
+    const path = new Set(expanding).add(name);
+    const properties = {};
+    Object.entries(definitions[name]).forEach(([fieldName, field]) => {
+      const resolved = resolveNode(field, path);
+      if (resolved !== undefined) {
+        properties[fieldName] = resolved;
+      }
+    });
+    return properties;
+  };
+
+  const resolveNode = (node, expanding) => {
+    if (!node) {
+      return node;
+    }
+    let resolved = node;
+    if (node.$ref !== undefined) {
+      const name = refName(node.$ref);
+      if (expanding.has(name)) {
+        return undefined;
+      }
+      // eslint-disable-next-line no-unused-vars
+      const { $ref, ...rest } = node;
+      resolved = { ...rest, properties: resolveDefinition(name, expanding) };
+    }
+    if (resolved.items !== undefined) {
+      const items = resolveNode(resolved.items, expanding);
+      if (items === undefined) {
+        return undefined;
+      }
+      resolved = { ...resolved, items };
+    }
+    return resolved;
+  };
+
+  return resolveDefinition(refName(schema.$ref), new Set());
+};
+
+const resolveActionsRefs = (actions) => {
+  Object.values(actions).forEach((action) => {
+    if (action.payload_schema !== undefined) {
+      action.payload_schema = resolveSchemaRefs(action.payload_schema);
+    }
+  });
+  return actions;
+};
+
+/**
+ * Leave out the actions the current identity is not allowed to perform.
+ */
+export const omitHiddenActions = (actions, hiddenActions) => {
+  const allowed = {};
+  Object.entries(actions).forEach(([actionKey, action]) => {
+    if (!hiddenActions.includes(actionKey)) {
+      allowed[actionKey] = action;
+    }
+  });
+  return allowed;
+};
+
+/**
+ * Load the resource schema and the actions of an administration view.
+ *
+ * Schemas inlined in the container's data attributes take precedence,
+ * otherwise they are fetched from the (browser cached) view schema endpoint.
+ * The schemas are shared by all identities, the actions listed in the
+ * container's hidden actions are left out.
+ */
+export const loadViewSchemas = async (domContainer) => {
+  const { resourceSchema, actions, schemaUrl } = domContainer.dataset;
+  const hiddenActions = JSON.parse(domContainer.dataset.hiddenActions || "[]");
+  if (resourceSchema !== undefined) {
+    return {
+      resourceSchema: resolveSchemaRefs(JSON.parse(resourceSchema)),
+      actions: resolveActionsRefs(
+        omitHiddenActions(actions !== undefined ? JSON.parse(actions) : {}, hiddenActions)
+      ),
+    };
+  }
+  const response = await http.get(schemaUrl);
+  return {
+    resourceSchema: resolveSchemaRefs(response.data.resource_schema),
+    actions: resolveActionsRefs(omitHiddenActions(response.data.actions, hiddenActions)),
+  };
+};
@@ -0,0 +1,42 @@
+import { omitHiddenActions, resolveSchemaRefs } from "./schemas";
+
+const schema = {
+  "$ref": "#/$defs/NodeSchema",
+  "$defs": {
+    NodeSchema: {
+      name: { type: "string" },
+      author: { type: "object", $ref: "#/$defs/AuthorSchema" },
+      children: { type: "array", items: { type: "object", $ref: "#/$defs/NodeSchema" } },
+    },
+    AuthorSchema: {
+      name: { type: "string" },
+    },
+  },
+};
+
+it("resolves references into nested properties", () => {
+  const resolved = resolveSchemaRefs(schema);
+  expect(resolved.name).toEqual({ type: "string" });
+  expect(resolved.author).toEqual({
+    type: "object",
+    properties: { name: { type: "string" } },
+  });
+});
+
+it("leaves out recursive fields", () => {
+  const resolved = resolveSchemaRefs(schema);
+  expect(resolved.children).toBeUndefined();
+  // the definitions table is not modified
+  expect(schema.$defs.NodeSchema.author.$ref).toEqual("#/$defs/AuthorSchema");
+});
+
+it("leaves out the hidden actions", () => {
+  const actions = {
+    block: { text: "Block", order: 1 },
+    verify: { text: "Verify", order: 2 },
+  };
+  expect(omitHiddenActions(actions, ["block"])).toEqual({
+    verify: { text: "Verify", order: 2 },
+  });
+  expect(omitHiddenActions(actions, [])).toEqual(actions);
+});
@@ -9,3 +9,4 @@ export { default as BoolFormatter } from "./BoolFormatter";
 export { default as Formatter } from "./Formatter";
 export { default as Loader } from "./Loader";
 export { default as ErrorPage } from "./ErrorPage";
+export { renderErrorPage } from "./renderErrorPage";
@@ -0,0 +1,26 @@
+// This file is part of InvenioAdministration
+// Copyright (C) 2022 CERN.
+//
+// Invenio is free software; you can redistribute it and/or modify it
+// under the terms of the MIT License; see LICENSE file for more details.
+
+import React from "react";
+import ReactDOM from "react-dom";
+import ErrorPage from "./ErrorPage";
+import { errorSerializer } from "../api/serializers";
+
+/**
+ * Render the error page in place of an administration page that failed to load.
+ */
+export const renderErrorPage = (domContainer, error) => {
+  console.error(error);
+  const status = error?.response?.status;
+  ReactDOM.render(
+    <ErrorPage
+      error
+      errorCode={status ? `${status}` : undefined}
+      errorMessage={errorSerializer(error)}
+    />,
+    domContainer
+  );
+};
@@ -12,15 +12,20 @@ import { Loader, ErrorPage } from "../components";
 export default class AdminDetailsView extends Component {
   constructor(props) {
     super(props);
+    const { record } = props;
     this.state = {
-      loading: true,
-      data: undefined,
+      loading: record === undefined,
+      data: record,
       error: undefined,
     };
   }
 
   componentDidMount() {
-    this.fetchData();
+    const { record } = this.props;
+    // the record is inlined in the page if prefetched
+    if (record === undefined) {
+      this.fetchData();
+    }
   }
 
   fetchData = async () => {
@@ -123,6 +128,7 @@ AdminDetailsView.propTypes = {
   displayEdit: PropTypes.bool.isRequired,
   displayDelete: PropTypes.bool.isRequired,
   pid: PropTypes.string.isRequired,
+  record: PropTypes.object,
   title: PropTypes.string.isRequired,
   children: PropTypes.object,
   resourceName: PropTypes.string.isRequired,
@@ -136,4 +142,5 @@ AdminDetailsView.propTypes = {
 AdminDetailsView.defaultProps = {
   actions: undefined,
   children: undefined,
+  record: undefined,
 };
@@ -8,39 +8,45 @@ import React from "react";
 import ReactDOM from "react-dom";
 import _get from "lodash/get";
 import AdminDetailsView from "./AdminDetailsView";
+import { loadViewSchemas } from "../api/schemas";
+import { renderErrorPage } from "../components/renderErrorPage";
 
 const domContainer = document.getElementById("invenio-details-config");
 
 const title = domContainer.dataset.title;
 const fields = JSON.parse(domContainer.dataset.fields);
 const pidValue = JSON.parse(domContainer.dataset.pid);
+const record = domContainer.dataset.record
+  ? JSON.parse(domContainer.dataset.record)
+  : undefined;
 const resourceName = JSON.parse(domContainer.dataset.resourceName);
 const displayEdit = JSON.parse(domContainer.dataset.displayEdit);
 const displayDelete = JSON.parse(domContainer.dataset.displayDelete);
-const actions = JSON.parse(domContainer.dataset.actions);
 const apiEndpoint = _get(domContainer.dataset, "apiEndpoint");
 const idKeyPath = JSON.parse(_get(domContainer.dataset, "pidPath", "pid"));
 const listUIEndpoint = domContainer.dataset.listEndpoint;
-const resourceSchema = JSON.parse(domContainer.dataset?.resourceSchema);
 const requestHeaders = JSON.parse(domContainer.dataset?.requestHeaders);
 const uiSchema = JSON.parse(domContainer.dataset?.uiConfig);
 
 domContainer &&
-  ReactDOM.render(
-    <AdminDetailsView
-      title={title}
-      actions={actions}
-      apiEndpoint={apiEndpoint}
-      columns={fields}
-      pid={pidValue}
-      displayEdit={displayEdit}
-      displayDelete={displayDelete}
-      idKeyPath={idKeyPath}
-      resourceName={resourceName}
-      listUIEndpoint={listUIEndpoint}
-      resourceSchema={resourceSchema}
-      requestHeaders={requestHeaders}
-      uiSchema={uiSchema}
-    />,
-    domContainer
-  );
+  loadViewSchemas(domContainer).then(({ resourceSchema, actions }) =>
+    ReactDOM.render(
+      <AdminDetailsView
+        title={title}
+        actions={actions}
+        apiEndpoint={apiEndpoint}
+        columns={fields}
+        pid={pidValue}
+        record={record}
+        displayEdit={displayEdit}
+        displayDelete={displayDelete}
+        idKeyPath={idKeyPath}
+        resourceName={resourceName}
+        listUIEndpoint={listUIEndpoint}
+        resourceSchema={resourceSchema}
+        requestHeaders={requestHeaders}
+        uiSchema={uiSchema}
+      />,
+      domContainer
+    )
+  ).catch((error) => renderErrorPage(domContainer, error));
@@ -11,11 +11,21 @@ import _isEmpty from "lodash/isEmpty";
 export class EditPage extends Component {
   constructor(props) {
     super(props);
-    this.state = { loading: true, resource: undefined, error: undefined };
+    const { record, recordEtag } = props;
+    this.state = {
+      loading: record === undefined,
+      resource: record,
+      etag: recordEtag,
+      error: undefined,
+    };
   }
 
   componentDidMount() {
-    this.getResource();
+    const { record } = this.props;
+    // the record is inlined in the page if prefetched
+    if (record === undefined) {
+      this.getResource();
+    }
   }
 
   getResource = async () => {
@@ -28,6 +38,7 @@ export class EditPage extends Component {
       this.setState({
         loading: false,
         resource: response.data,
+        etag: response.headers.etag,
         error: undefined,
       });
     } catch (e) {
@@ -43,7 +54,7 @@ export class EditPage extends Component {
 
   render() {
     const { resourceSchema, apiEndpoint, pid, formFields } = this.props;
-    const { loading, resource, error } = this.state;
+    const { loading, resource, etag, error } = this.state;
 
     return (
       <Loader isLoading={loading}>
@@ -60,6 +71,7 @@ export class EditPage extends Component {
                 apiEndpoint={apiEndpoint}
                 formFields={formFields}
                 pid={pid}
+                etag={etag}
                 successCallback={this.handleOnEditSuccess}
               />
             </Grid.Column>
@@ -74,10 +86,14 @@ EditPage.propTypes = {
   resourceSchema: PropTypes.object.isRequired,
   apiEndpoint: PropTypes.string.isRequired,
   pid: PropTypes.string.isRequired,
+  record: PropTypes.object,
+  recordEtag: PropTypes.string,
   formFields: PropTypes.object,
   listUIEndpoint: PropTypes.string.isRequired,
 };
 
 EditPage.defaultProps = {
   formFields: undefined,
+  record: undefined,
+  recordEtag: undefined,
 };
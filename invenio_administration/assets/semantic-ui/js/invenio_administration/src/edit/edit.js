@@ -9,23 +9,34 @@ import ReactDOM from "react-dom";
 import { EditPage } from "./EditPage";
 import _get from "lodash/get";
 import { NotificationController } from "../ui_messages/context";
+import { loadViewSchemas } from "../api/schemas";
+import { renderErrorPage } from "../components/renderErrorPage";
 
 const domContainer = document.getElementById("invenio-administration-edit-root");
-const resourceSchema = JSON.parse(domContainer.dataset.resourceSchema);
 const apiEndpoint = _get(domContainer.dataset, "apiEndpoint");
 const pid = JSON.parse(domContainer.dataset.pid);
+const record = domContainer.dataset.record
+  ? JSON.parse(domContainer.dataset.record)
+  : undefined;
+const recordEtag = domContainer.dataset.recordEtag
+  ? JSON.parse(domContainer.dataset.recordEtag)
+  : undefined;
 const formFields = JSON.parse(domContainer.dataset.formFields);
 const listUIEndpoint = domContainer.dataset.listEndpoint;
 
-ReactDOM.render(
-  <NotificationController>
-    <EditPage
-      resourceSchema={resourceSchema}
-      apiEndpoint={apiEndpoint}
-      formFields={formFields}
-      pid={pid}
-      listUIEndpoint={listUIEndpoint}
-    />
-  </NotificationController>,
-  domContainer
-);
+loadViewSchemas(domContainer).then(({ resourceSchema }) =>
+  ReactDOM.render(
+    <NotificationController>
+      <EditPage
+        resourceSchema={resourceSchema}
+        apiEndpoint={apiEndpoint}
+        formFields={formFields}
+        pid={pid}
+        record={record}
+        recordEtag={recordEtag}
+        listUIEndpoint={listUIEndpoint}
+      />
+    </NotificationController>,
+    domContainer
+  )
+).catch((error) => renderErrorPage(domContainer, error));
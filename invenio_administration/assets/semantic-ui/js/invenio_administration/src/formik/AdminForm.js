@@ -30,7 +30,7 @@ export class AdminForm extends Component {
   static contextType = NotificationContext;
 
   onSubmit = async (values, actions) => {
-    const { apiEndpoint, pid, successCallback, create } = this.props;
+    const { apiEndpoint, pid, etag, successCallback, create } = this.props;
     const { addNotification } = this.context;
     let response;
     try {
@@ -43,7 +43,8 @@ export class AdminForm extends Component {
         response = await InvenioAdministrationActionsApi.editResource(
           apiEndpoint,
           pid,
-          values
+          values,
+          etag
         );
       }
       actions.setSubmitting(false);
@@ -121,6 +122,7 @@ AdminForm.propTypes = {
   resourceSchema: PropTypes.object.isRequired,
   apiEndpoint: PropTypes.string.isRequired,
   pid: PropTypes.string,
+  etag: PropTypes.string,
   create: PropTypes.bool,
   formFields: PropTypes.object,
   successCallback: PropTypes.func,
@@ -130,6 +132,7 @@ AdminForm.defaultProps = {
   resource: undefined,
   create: false,
   pid: undefined,
+  etag: undefined,
   formFields: undefined,
   successCallback: () => {},
 };
@@ -0,0 +1,63 @@
+/*
+ * This file is part of Invenio.
+ * Copyright (C) 2022 CERN.
+ *
+ * Invenio is free software; you can redistribute it and/or modify it
+ * under the terms of the MIT License; see LICENSE file for more details.
+ */
+
+import React from "react";
+import { Dropdown } from "semantic-ui-react";
+import { withState } from "react-searchkit";
+import { i18next } from "@translations/invenio_administration/i18next";
+import PropTypes from "prop-types";
+
+/**
+ * Serialize the query of the search app as the search API arguments.
+ *
+ * Nested facet values are joined with "::", as by the search app's requests.
+ */
+export const exportQueryString = ({ queryString, sortBy, filters = [] }) => {
+  const params = new URLSearchParams();
+  if (queryString) {
+    params.append("q", queryString);
+  }
+  if (sortBy) {
+    params.append("sort", sortBy);
+  }
+  const addFilter = (filter, prefix = "") => {
+    const [name, value, child] = filter;
+    if (child) {
+      addFilter(child, `${prefix}${value}::`);
+    } else {
+      params.append(name, `${prefix}${value}`);
+    }
+  };
+  filters.forEach((filter) => addFilter(filter));
+  return params.toString();
+};
+
+const ExportDropdownComponent = ({ exportUrls, currentQueryState }) => {
+  const query = exportQueryString(currentQueryState);
+  return (
+    <Dropdown text={i18next.t("Export")} button compact className="basic">
+      <Dropdown.Menu>
+        {Object.entries(exportUrls).map(([exportFormat, url]) => (
+          <Dropdown.Item
+            key={exportFormat}
+            as="a"
+            href={query ? `${url}?${query}` : url}
+            text={exportFormat.toUpperCase()}
+          />
+        ))}
+      </Dropdown.Menu>
+    </Dropdown>
+  );
+};
+
+ExportDropdownComponent.propTypes = {
+  exportUrls: PropTypes.object.isRequired,
+  currentQueryState: PropTypes.object.isRequired,
+};
+
+export const ExportDropdown = withState(ExportDropdownComponent);
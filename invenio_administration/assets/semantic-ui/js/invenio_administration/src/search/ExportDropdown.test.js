@@ -0,0 +1,21 @@
+import { exportQueryString } from "./ExportDropdown";
+
+it("serializes the query as the search API arguments", () => {
+  const query = exportQueryString({
+    queryString: "title:test",
+    sortBy: "newest",
+    page: 3,
+    size: 20,
+    filters: [
+      ["status", "blocked"],
+      ["type", "publication", ["subtype", "article"]],
+    ],
+  });
+  expect(query).toEqual(
+    "q=title%3Atest&sort=newest&status=blocked&type=publication%3A%3Aarticle"
+  );
+});
+
+it("serializes an empty query", () => {
+  expect(exportQueryString({ queryString: "", page: 1 })).toEqual("");
+});
@@ -21,7 +21,14 @@ import {
 } from "@js/invenio_search_ui/components";
 import { SearchBar } from "./SearchBar";
 
-export const initDefaultSearchComponents = (domContainer) => {
+export const initDefaultSearchComponents = (
+  domContainer,
+  // defaults to the schemas inlined in the container (ADMINISTRATION_INLINE_SCHEMAS)
+  {
+    resourceSchema = JSON.parse(domContainer.dataset.resourceSchema || "{}"),
+    actions = JSON.parse(domContainer.dataset.actions || "{}"),
+  } = {}
+) => {
   const sortColumns = (columns) =>
     Object.entries(columns).sort((a, b) => a[1].order - b[1].order);
   const title = JSON.parse(domContainer.dataset.title);
@@ -32,11 +39,10 @@ export const initDefaultSearchComponents = (domContainer) => {
   const displayEdit = JSON.parse(domContainer.dataset.displayEdit);
   const displayDelete = JSON.parse(domContainer.dataset.displayDelete);
   const displayRead = JSON.parse(domContainer.dataset.displayRead);
-  const actions = JSON.parse(domContainer.dataset.actions);
   const apiEndpoint = _get(domContainer.dataset, "apiEndpoint");
   const idKeyPath = JSON.parse(_get(domContainer.dataset, "pidPath", "pid"));
   const listUIEndpoint = domContainer.dataset.listEndpoint;
-  const resourceSchema = JSON.parse(domContainer.dataset.resourceSchema);
+  const exportUrls = JSON.parse(domContainer.dataset.exportUrls || "{}");
 
   const ResultsContainerWithConfig = parametrize(SearchResultsContainer, {
     columns: sortedColumns,
@@ -47,6 +53,7 @@ export const initDefaultSearchComponents = (domContainer) => {
 
   const SearchResultsWithConfig = parametrize(SearchResults, {
     columns: sortedColumns,
+    exportUrls: exportUrls,
   });
 
   const SearchResultItemWithConfig = parametrize(SearchResultItem, {
@@ -11,8 +11,14 @@ import { Grid } from "semantic-ui-react";
 import { ResultsList, Pagination, ResultsPerPage, Count } from "react-searchkit";
 import { i18next } from "@translations/invenio_administration/i18next";
 import PropTypes from "prop-types";
+import _isEmpty from "lodash/isEmpty";
+import { ExportDropdown } from "./ExportDropdown";
 
-export const SearchResults = ({ paginationOptions, currentResultsState }) => {
+export const SearchResults = ({
+  paginationOptions,
+  currentResultsState,
+  exportUrls,
+}) => {
   const { total } = currentResultsState.data;
 
   return (
@@ -38,6 +44,7 @@ export const SearchResults = ({ paginationOptions, currentResultsState }) => {
                 </>
               )}
             />
+            {!_isEmpty(exportUrls) && <ExportDropdown exportUrls={exportUrls} />}
           </Grid.Column>
           <Grid.Column width={8} textAlign="center">
             <Pagination
@@ -68,4 +75,9 @@ export const SearchResults = ({ paginationOptions, currentResultsState }) => {
 SearchResults.propTypes = {
   paginationOptions: PropTypes.object.isRequired,
   currentResultsState: PropTypes.object.isRequired,
+  exportUrls: PropTypes.object,
+};
+
+SearchResults.defaultProps = {
+  exportUrls: {},
 };
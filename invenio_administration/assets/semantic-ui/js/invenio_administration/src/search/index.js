@@ -6,6 +6,7 @@
 
 export { initDefaultSearchComponents } from "./SearchComponents";
 export { SearchBarElement } from "./SearchBarElement";
+export { ExportDropdown } from "./ExportDropdown";
 export { default as SearchEmptyResults } from "./SearchEmptyResults";
 export { SearchFacets } from "./SearchFacets";
 export { SearchResultItem } from "./SearchResultItem";
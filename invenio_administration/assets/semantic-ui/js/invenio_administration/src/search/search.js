@@ -9,15 +9,25 @@
 import { createSearchAppInit } from "@js/invenio_search_ui";
 import { NotificationController } from "../ui_messages/context";
 import { initDefaultSearchComponents } from "./SearchComponents";
+import { loadViewSchemas } from "../api/schemas";
+import { hydrateFirstSearch } from "../api/prefetch";
+import { paginateWithCursors } from "../api/cursor";
+import { renderErrorPage } from "../components/renderErrorPage";
 
 const domContainer = document.getElementById("invenio-search-config");
 
-const defaultComponents = initDefaultSearchComponents(domContainer);
+loadViewSchemas(domContainer).then((schemas) => {
+  const defaultComponents = initDefaultSearchComponents(domContainer, schemas);
+  hydrateFirstSearch(domContainer);
+  if (JSON.parse(domContainer.dataset.cursorPagination || "false")) {
+    paginateWithCursors(domContainer);
+  }
 
-createSearchAppInit(
-  defaultComponents,
-  true,
-  "invenio-search-config",
-  false,
-  NotificationController
-);
+  createSearchAppInit(
+    defaultComponents,
+    true,
+    "invenio-search-config",
+    false,
+    NotificationController
+  );
+}).catch((error) => renderErrorPage(domContainer, error));
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration command line interface."""
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from flask_babelex import get_locale
+
+from .profiling import STAGES
+from .proxies import current_administration
+
+
+@click.group()
+def administration():
+    """Administration commands."""
+
+
+@administration.group()
+def schemas():
+    """Administration view schemas commands."""
+
+
+@schemas.command("compile")
+@with_appcontext
+def compile_schemas():
+    """Precompile the schemas of all administration views."""
+    admin = current_administration.administration
+    admin.load_lazy_views()
+    current_administration.resolve_resources()
+    with current_app.test_request_context():
+        documents = admin.build_schema_documents()
+        manifest = admin.schema_artifacts.write(documents, str(get_locale()))
+    admin.invalidate_schema_documents()
+
+    for name, filename in sorted(manifest["views"].items()):
+        click.echo(f"{name}: {filename}")
+    click.secho(
+        f"Compiled {len(documents)} schemas into {admin.schema_artifacts.path}",
+        fg="green",
+    )
+
+
+@administration.command()
+@with_appcontext
+def warmup():
+    """Warm up the administration views and report their timings."""
+    timings = current_administration.warmup(current_app._get_current_object())
+    for name, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+        click.echo(f"{name}: {seconds * 1000:.1f} ms")
+    click.secho(
+        f"Warmed up {len(timings)} views in {sum(timings.values()) * 1000:.1f} ms",
+        fg="green",
+    )
+
+
+@administration.command()
+@with_appcontext
+def preload():
+    """Report the memory shared by preloading the administration views."""
+    report = current_administration.preload(current_app._get_current_object())
+    click.echo(f"Views: {len(report.timings)}")
+    click.echo(f"Frozen objects: {report.frozen_objects}")
+    if report.rss_before is not None:
+        shared = (report.rss_after - report.rss_before) / 2**20
+        click.echo(f"RSS before: {report.rss_before / 2**20:.1f} MiB")
+        click.echo(f"RSS after: {report.rss_after / 2**20:.1f} MiB")
+        click.secho(f"RSS saved per worker: {shared:.1f} MiB", fg="green")
+
+
+@administration.command()
+@with_appcontext
+def profile():
+    """Report the time and memory each view took to register."""
+    profiler = current_administration.startup_profiler
+    report = profiler.report()
+    if not report:
+        raise click.ClickException(
+            "No startup profile, set ADMINISTRATION_STARTUP_PROFILE to enable it."
+        )
+
+    for view in report:
+        stages = ", ".join(
+            f"{stage} {view.timings[stage] * 1000:.1f} ms"
+            f" / {view.memory[stage] / 2**10:.1f} KiB"
+            for stage in STAGES
+            if stage in view.timings
+        )
+        click.echo(
+            f"{view.name}: {view.total_time * 1000:.1f} ms"
+            f" / {view.total_memory / 2**10:.1f} KiB ({stages})"
+        )
+    click.secho(
+        f"Registered {len(report)} views in "
+        f"{sum(view.total_time for view in report) * 1000:.1f} ms",
+        fg="green",
+    )
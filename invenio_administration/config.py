@@ -22,3 +22,103 @@ ADMINISTRATION_DASHBOARD_VIEW = (
 
 ADMINISTRATION_THEME_BASE_TEMPLATE = "invenio_theme/page.html"
 """Administration base template."""
+
+ADMINISTRATION_SCHEMA_CACHE_MAXSIZE = 256
+"""Maximum number of serialized marshmallow schemas kept in memory."""
+
+ADMINISTRATION_SIDEBAR_CACHE_MAXSIZE = 512
+"""Maximum number of rendered sidebar menus kept in memory, ``0`` disables it.
+
+Rendered menus are cached per locale, active and visible menu items.
+"""
+
+ADMINISTRATION_INLINE_SCHEMAS = False
+"""Embed the serialized schemas in the HTML pages.
+
+By default the pages reference the cacheable schema endpoint of each view.
+"""
+
+ADMINISTRATION_SCHEMA_MAX_AGE = 31536000
+"""Cache-Control max-age (in seconds) of the view schema endpoint responses."""
+
+ADMINISTRATION_SCHEMAS_ARTIFACTS_PATH = None
+"""Directory of the precompiled schema artifacts.
+
+Defaults to ``<instance_path>/administration/schemas``, see the
+``flask administration schemas compile`` command. Artifacts compiled with
+other package versions or schema serialization settings are ignored.
+"""
+
+ADMINISTRATION_SCHEMA_REFS = False
+"""Serialize nested schemas once in a definitions table referenced by ``$ref``.
+
+Reduces the size of schemas reusing the same nested schemas (e.g. vocabulary
+relations) and is required for recursive schemas.
+"""
+
+ADMINISTRATION_SCHEMA_MAX_DEPTH = 10
+"""Maximum nesting depth of the serialized schemas."""
+
+ADMINISTRATION_SCHEMA_PROJECTION = True
+"""Serialize only the schema fields displayed by each view.
+
+Uses the view's ``item_field_list`` or ``form_fields`` and its ``pid_path``.
+Views without such configuration serialize the whole schema.
+"""
+
+ADMINISTRATION_PREFETCH_SEARCH = False
+"""Embed the first page of search results in the list views.
+
+Saves the search app a round trip to the API before showing results, views
+can override it with their ``prefetch_search`` attribute.
+"""
+
+ADMINISTRATION_PREFETCH_RECORD = False
+"""Inline the record in the detail and edit views, with its ETag.
+
+Saves the page a request to the API, views can override it with their
+``prefetch_record`` attribute.
+"""
+
+ADMINISTRATION_PRELOAD = False
+"""Prepare the views in the master process and freeze them before forking.
+
+Used by :mod:`invenio_administration.wsgi` in pre-forking servers such as
+``gunicorn --preload``, see :meth:`InvenioAdministration.preload`.
+"""
+
+ADMINISTRATION_SHARED_VIEWS = False
+"""Dispatch all the requests to a view to the instance created on registration.
+
+Saves instantiating and validating the view on every request. Shared view
+instances are frozen, views must keep per-request state in locals or
+:data:`flask.g`.
+"""
+
+ADMINISTRATION_ENTRY_POINTS_CACHE = None
+"""File caching the discovered administration entry points.
+
+Avoids scanning all the installed distributions on every application
+creation, e.g. ``"/opt/invenio/var/instance/administration/entry_points.json"``.
+The cache is rebuilt when the installed distributions change. Disabled when
+``None``.
+"""
+
+ADMINISTRATION_LAZY_VIEWS = False
+"""Import the views only when they are first dispatched.
+
+URL rules and menu entries are registered from the views' metadata, stored
+in the ``ADMINISTRATION_ENTRY_POINTS_CACHE`` file when the views are first
+imported, so that processes not serving administration pages (e.g. Celery
+workers) do not import them. Requires ``ADMINISTRATION_ENTRY_POINTS_CACHE``.
+"""
+
+ADMINISTRATION_STARTUP_PROFILE = False
+"""Profile the time and memory each view takes to register.
+
+Reported by ``flask administration profile``, e.g. with
+``INVENIO_ADMINISTRATION_STARTUP_PROFILE=1``.
+"""
+
+ADMINISTRATION_STARTUP_PROFILE_LOG = False
+"""Log the startup profile of each view, see ``ADMINISTRATION_STARTUP_PROFILE``."""
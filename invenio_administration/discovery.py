@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Entry point discovery, optionally cached on disk."""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+import importlib_metadata
+from flask import json
+
+
+def environment_fingerprint():
+    """Fingerprint of the installed distributions.
+
+    Installing, upgrading or removing a distribution modifies the directory it
+    is installed in, so the modification times of the import path entries
+    identify the environment with one ``stat`` per entry.
+    """
+    entries = [sys.version]
+    for path in sys.path:
+        try:
+            entries.append(f"{path}:{os.stat(path or '.').st_mtime_ns}")
+        except OSError:
+            continue
+    return hashlib.sha1("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+class DiscoveryCache:
+    """Discovery results stored on disk for the current environment.
+
+    The stored results are discarded when the :func:`environment_fingerprint`
+    changes.
+    """
+
+    def __init__(self, path):
+        """Constructor.
+
+        :param path: file holding the cached results.
+        """
+        self.path = path
+        self._data = None
+
+    @property
+    def data(self):
+        """Cached results of the current environment."""
+        if self._data is None:
+            fingerprint = environment_fingerprint()
+            try:
+                with open(self.path) as fp:
+                    data = json.load(fp)
+            except (OSError, ValueError):
+                data = {}
+            if data.get("fingerprint") != fingerprint:
+                data = {"fingerprint": fingerprint}
+            self._data = data
+        return self._data
+
+    def get(self, key):
+        """Get a cached result, ``None`` if not cached."""
+        return self.data.get(key)
+
+    def set(self, key, value):
+        """Cache a result.
+
+        Unwritable locations (e.g. read-only file systems) are ignored, the
+        result is then discovered again by the next process.
+        """
+        self.data[key] = value
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # a file of its own, processes writing at once replace each other's
+            # complete files only
+            with tempfile.NamedTemporaryFile(
+                "w", dir=directory, suffix=".tmp", delete=False
+            ) as fp:
+                json.dump(self.data, fp)
+            os.replace(fp.name, self.path)
+        except OSError:
+            pass
+
+
+def discover_entry_points(groups, cache=None):
+    """Discover the entry points of the given groups.
+
+    :param groups: entry point group names.
+    :param cache: :class:`DiscoveryCache` storing the discovered entry points
+        across processes. All the installed distributions are scanned when
+        not given.
+    :returns: :class:`importlib_metadata.EntryPoints`, to select the groups
+        from.
+    """
+    if cache is None:
+        return importlib_metadata.entry_points()
+
+    key = "entry_points:" + ",".join(sorted(groups))
+    cached = cache.get(key)
+    if cached is not None:
+        return importlib_metadata.EntryPoints(
+            importlib_metadata.EntryPoint(name, value, group)
+            for name, value, group in cached
+        )
+
+    entry_points = importlib_metadata.entry_points()
+    cache.set(
+        key,
+        [
+            [ep.name, ep.value, ep.group]
+            for group in sorted(groups)
+            for ep in entry_points.select(group=group)
+        ],
+    )
+    return entry_points
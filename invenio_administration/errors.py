@@ -89,3 +89,56 @@ class MissingDefaultGetView(Exception):
                 )
             )
         )
+
+
+class RecursiveSchema(Exception):
+    """Exception for recursive schemas serialized without references."""
+
+    def __init__(self, name):
+        """Initialise error."""
+        super().__init__(
+            _(
+                "Schema {name} is recursive and can only be serialized with "
+                "references.".format(name=name)
+            )
+        )
+
+
+class SchemaMaxDepthExceeded(Exception):
+    """Exception for schemas nested deeper than the allowed depth."""
+
+    def __init__(self, name, max_depth):
+        """Initialise error."""
+        super().__init__(
+            _(
+                "Schema {name} exceeds the maximum nesting depth of "
+                "{max_depth}.".format(name=name, max_depth=max_depth)
+            )
+        )
+
+
+class UnrecognisedSchemaField(Exception):
+    """Exception for schema fields without a registered serializer."""
+
+    def __init__(self, field_type, field_name=None):
+        """Initialise error."""
+        if field_name is None:
+            message = _(
+                "Unrecognised schema field type {field_type}.".format(
+                    field_type=field_type
+                )
+            )
+        else:
+            message = _(
+                "Unrecognised schema field type {field_type} of field "
+                "{field_name}.".format(field_type=field_type, field_name=field_name)
+            )
+        super().__init__(message)
+
+
+class InvalidCursor(ValueError):
+    """Exception for pagination cursors which cannot be decoded."""
+
+    def __init__(self, cursor):
+        """Initialise error."""
+        super().__init__(_("Invalid pagination cursor {cursor}.".format(cursor=cursor)))
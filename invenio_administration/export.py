@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Export of the list views' results, streamed row by row."""
+
+import csv
+import io
+
+from flask import json
+
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+"""Mimetypes of the export formats."""
+
+# leading characters of spreadsheet formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def get_field(data, path):
+    """Get the value of a dotted field path, ``None`` if missing."""
+    value = data
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _csv_cell(value):
+    """Format a value as a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        # not evaluated by the spreadsheets opening the export
+        return f"'{value}"
+    return value
+
+
+def csv_lines(fields, rows):
+    """Serialize rows as CSV lines, the first one naming the fields."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue()
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow([_csv_cell(value) for value in row])
+        yield buffer.getvalue()
+
+
+def jsonl_lines(fields, rows):
+    """Serialize rows as JSON lines, objects keyed by field."""
+    for row in rows:
+        yield json.dumps(dict(zip(fields, row))) + "\n"
+
+
+EXPORT_SERIALIZERS = {
+    "csv": csv_lines,
+    "jsonl": jsonl_lines,
+}
+"""Serializers of the export formats, taking the fields and the rows."""
@@ -8,51 +8,144 @@
 
 """Invenio admin extension."""
 
+import gc
+import os
+import time
+from collections import namedtuple
+
 import importlib_metadata
+from flask_principal import identity_loaded
 
 from . import config
 from .admin import Administration
+from .discovery import DiscoveryCache, discover_entry_points
+from .lazy import LazyView, dump_view_metadata
+from .marshmallow_utils import SchemaJSONCache, create_field_types
+from .permissions import clear_permission_decisions
+from .profiling import StartupProfiler
 from .views.base import AdminResourceBaseView, AdminView
 
+PreloadReport = namedtuple(
+    "PreloadReport", ["timings", "rss_before", "rss_after", "frozen_objects"]
+)
+"""Report of :meth:`InvenioAdministration.preload`.
+
+``rss_after - rss_before`` is the memory each forked worker shares with the
+master instead of building it on its own, RSS values are in bytes.
+"""
+
+
+def _rss():
+    """Resident set size of the current process in bytes, ``None`` if unknown."""
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
 
 class InvenioAdministration:
     """Invenio extension."""
 
-    def __init__(self, app=None, entry_point_group="invenio_administration.views"):
+    def __init__(
+        self,
+        app=None,
+        entry_point_group="invenio_administration.views",
+        field_types_entry_point_group="invenio_administration.schema_fields",
+    ):
         """Extension initialization."""
         self.entry_point_group = entry_point_group
+        self.field_types_entry_point_group = field_types_entry_point_group
 
         self.administration = None
+        self.field_types = None
+        self.schema_cache = None
+        self.discovery_cache = None
+        self.startup_profiler = StartupProfiler(enabled=False)
+        self._resource_views = {}
+        self.warmed_up = False
         if app:
             self.init_app(app)
 
     def init_app(self, app):
         """Initialize application."""
         self.init_config(app)
+        self.startup_profiler = StartupProfiler(
+            enabled=app.config["ADMINISTRATION_STARTUP_PROFILE"]
+        )
+        self.field_types = create_field_types()
+        self.schema_cache = SchemaJSONCache(
+            maxsize=app.config["ADMINISTRATION_SCHEMA_CACHE_MAXSIZE"],
+            field_types=self.field_types,
+        )
         self.administration = Administration(
             app,
             name=app.config["ADMINISTRATION_APPNAME"],
             base_template=app.config["ADMINISTRATION_BASE_TEMPLATE"],
         )
+        if app.config["ADMINISTRATION_ENTRY_POINTS_CACHE"]:
+            self.discovery_cache = DiscoveryCache(
+                app.config["ADMINISTRATION_ENTRY_POINTS_CACHE"]
+            )
+        # discover the entry points once for both groups
+        groups = [self.entry_point_group, self.field_types_entry_point_group]
+        entry_points = discover_entry_points(
+            [group for group in groups if group], self.discovery_cache
+        )
+        if self.field_types_entry_point_group:
+            self.field_types.load_entry_points(
+                entry_points.select(group=self.field_types_entry_point_group)
+            )
         if self.entry_point_group:
-            self.load_entry_point_group(app)
+            self.load_entry_point_group(app, entry_points)
+        self.startup_profiler.stop()
+        if app.config["ADMINISTRATION_STARTUP_PROFILE_LOG"]:
+            self.log_startup_profile(app)
+        app.before_first_request(self._init_on_first_request)
+        identity_loaded.connect(clear_permission_decisions, app)
         app.extensions["invenio-administration"] = self
 
-    def load_entry_point_group(self, app):
-        """Load admin interface views from entry point group."""
-        entrypoints = set(importlib_metadata.entry_points(group=self.entry_point_group))
-        for ep in entrypoints:
-            entry_point = self._load_entry_point(ep)
-            entrypoint_path = ep.value
+    def load_entry_point_group(self, app, entry_points=None):
+        """Load admin interface views from entry point group.
 
-            extension_name_from_path = self._extract_extension_name(entrypoint_path)
-            extension_name_from_view = entry_point.extension_name
-            # fallback to extracted extension_name if property not set on view
-            extension_name = extension_name_from_view or extension_name_from_path
+        :param entry_points: installed entry points to select the group from,
+            scanned when not given.
+        """
+        if entry_points is None:
+            entry_points = importlib_metadata.entry_points()
+        lazy = app.config["ADMINISTRATION_LAZY_VIEWS"] and self.discovery_cache
+        views_metadata = (lazy and self.discovery_cache.get("views")) or {}
+        missing_metadata = False
 
+        entrypoints = set(entry_points.select(group=self.entry_point_group))
+        for ep in entrypoints:
+            if lazy and ep.value in views_metadata:
+                self.register_lazy_view(app, ep, views_metadata[ep.value])
+                continue
+
+            with self.startup_profiler.measure("import") as sample:
+                entry_point = self._load_entry_point(ep)
+                sample.view = entry_point.name
+            extension_name = self._get_extension_name(ep, entry_point)
             self.register_view(entry_point, extension_name, app)
+            if lazy:
+                view_instance = self.administration.get_view_instance(entry_point.name)
+                views_metadata[ep.value] = dump_view_metadata(
+                    view_instance, self.administration.has_menu_entry(view_instance)
+                )
+                missing_metadata = True
+
+        if missing_metadata:
+            self.discovery_cache.set("views", views_metadata)
         app.register_blueprint(self.administration.blueprint)
 
+    def _get_extension_name(self, ep, view_class):
+        """Get the name of the extension of a view loaded from an entry point."""
+        extension_name_from_path = self._extract_extension_name(ep.value)
+        extension_name_from_view = view_class.extension_name
+        # fallback to extracted extension_name if property not set on view
+        return extension_name_from_view or extension_name_from_path
+
     def _load_entry_point(self, entry_point):
         """Loads one entry point. Validates whether its view is an AdminView."""
         ep = entry_point.load()
@@ -68,30 +161,157 @@ class InvenioAdministration:
         :param args: Positional arguments for view class.
         :param kwargs: Keyword arguments to view class.
         """
-        view_instance = view_class(
-            extension_name=extension_name, admin=self.administration, *args, **kwargs
+        view, view_instance = self._create_view(
+            view_class, extension_name, *args, **kwargs
         )
-        view = view_class.as_view(
-            view_class.name,
-            extension_name=extension_name,
-            admin=self.administration,
-            *args,
-            **kwargs,
-        )
-        self.administration.add_view(view, view_instance, *args, **kwargs)
+        with self.startup_profiler.measure("add_view", view_class.name):
+            self.administration.add_view(view, view_instance, *args, **kwargs)
         if issubclass(view_class, AdminResourceBaseView):
             self.register_resource(app, view_class, extension_name)
 
-    @staticmethod
-    def register_resource(app, view_class, extension_name):
-        """Set views schema."""
-
-        @app.before_first_request
-        def register_view_resource():
-            if view_class.resource_config:
-                view_class.set_resource(extension_name=extension_name)
-            if view_class.schema:
-                view_class.set_schema(extension_name=extension_name)
+    def _create_view(self, view_class, extension_name, *args, **kwargs):
+        """Create the view function and the instance of a view class."""
+        profiler = self.startup_profiler
+        with profiler.measure("instantiate", view_class.name):
+            view_instance = view_class(
+                extension_name=extension_name,
+                admin=self.administration,
+                *args,
+                **kwargs,
+            )
+        with profiler.measure("as_view", view_class.name):
+            if self.administration.app.config["ADMINISTRATION_SHARED_VIEWS"]:
+                view = view_instance.as_shared_view()
+            else:
+                view = view_class.as_view(
+                    view_class.name,
+                    extension_name=extension_name,
+                    admin=self.administration,
+                    *args,
+                    **kwargs,
+                )
+        return view, view_instance
+
+    def register_lazy_view(self, app, entry_point, metadata):
+        """Register a view from its metadata, imported on first use.
+
+        :param entry_point: entry point of the view class.
+        :param metadata: view metadata, see
+            :func:`invenio_administration.lazy.dump_view_metadata`.
+        """
+
+        def load_view():
+            view_class = self._load_entry_point(entry_point)
+            extension_name = self._get_extension_name(entry_point, view_class)
+            view, view_instance = self._create_view(view_class, extension_name)
+            if issubclass(view_class, AdminResourceBaseView):
+                self.register_resource(app, view_class, extension_name)
+            return view, view_instance
+
+        self.administration.add_lazy_view(
+            LazyView(metadata, self.administration), load_view
+        )
+
+    def register_resource(self, app, view_class, extension_name):
+        """Register a resource view, its resource is resolved on first access."""
+        self._resource_views[view_class] = extension_name
+
+    def get_extension_name(self, view_class):
+        """Get the extension name a resource view was registered with."""
+        return self._resource_views.get(view_class)
+
+    def resolve_resources(self):
+        """Resolve the resources of all registered resource views."""
+        for view_class, extension_name in self._resource_views.items():
+            view_class.resolve_resource(extension_name)
+
+    def _init_on_first_request(self):
+        """Register the menu if the app was not warmed up."""
+        if not self.warmed_up:
+            self.administration.register_menu()
+
+    def warmup(self, app):
+        """Prepare the administration views ahead of the first request.
+
+        Resolves the views' resources, serializes their schemas, builds their
+        static contexts and registers the menu.
+
+        Meant to be called once the application and all its extensions are
+        created, e.g. by a WSGI preload hook (see
+        :mod:`invenio_administration.wsgi`) or with
+        ``flask administration warmup``. Schema documents and view contexts
+        are built for the default locale.
+
+        :returns: dictionary of view names to their warm-up time in seconds.
+            Views failing to warm up are logged and left out.
+        """
+        admin = self.administration
+        admin.load_lazy_views()
+        timings = {}
+        with app.test_request_context():
+            for view_class, extension_name in self._resource_views.items():
+                start = time.perf_counter()
+                try:
+                    view_class.resolve_resource(extension_name)
+                    view_instance = admin.get_view_instance(view_class.name)
+                    admin.get_schema_document(view_class.name)
+                    admin.get_static_context(view_instance)
+                except Exception:
+                    # the view fails on its own requests, not the whole app
+                    app.logger.exception(
+                        "Failed to warm up administration view %s", view_class.name
+                    )
+                    continue
+                timings[view_class.name] = time.perf_counter() - start
+            admin.register_menu()
+
+        self.warmed_up = True
+        return timings
+
+    def preload(self, app):
+        """Warm up in a pre-forking master and freeze the built state.
+
+        Objects created so far are moved out of the garbage collector's
+        tracked generations (:func:`gc.freeze`), so that collections in the
+        forked workers do not touch, and copy, the pages they share with the
+        master. Call it last before forking, e.g. with gunicorn ``--preload``
+        and :mod:`invenio_administration.wsgi`.
+
+        :returns: a :class:`PreloadReport`.
+        """
+        rss_before = _rss()
+        timings = self.warmup(app)
+        gc.collect()
+        gc.freeze()
+        return PreloadReport(timings, rss_before, _rss(), gc.get_freeze_count())
+
+    def log_startup_profile(self, app):
+        """Log the startup profile of each view, slowest first.
+
+        Records carry the profile as ``administration_view``,
+        ``startup_timings`` and ``startup_memory`` attributes for structured
+        log handlers.
+        """
+        for profile in self.startup_profiler.report():
+            app.logger.info(
+                "Administration view %s registered in %.1f ms, allocating %d bytes",
+                profile.name,
+                profile.total_time * 1000,
+                profile.total_memory,
+                extra={
+                    "administration_view": profile.name,
+                    "startup_timings": profile.timings,
+                    "startup_memory": profile.memory,
+                },
+            )
+
+    def invalidate_schemas(self, schema=None):
+        """Invalidate serialized schemas.
+
+        :param schema: schema class or instance to invalidate, defaults to all.
+        """
+        self.schema_cache.invalidate(schema)
+        self.administration.invalidate_schema_documents()
 
     @staticmethod
     def _extract_extension_name(entrypoint_path):
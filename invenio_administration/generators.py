@@ -8,17 +8,36 @@
 """Invenio-Administration Permissions Generators."""
 
 from invenio_records_permissions.generators import Generator
+from invenio_search.engine import dsl
 
-from invenio_administration.permissions import administration_access_action
+from invenio_administration.permissions import (
+    administration_access_action,
+    compile_permission,
+)
 
 
 class Administration(Generator):
     """Allows administration-access."""
 
-    def __init__(self):
-        """Constructor."""
+    def __init__(self, action=None):
+        """Constructor.
+
+        :param action: action need required instead of the
+            administration access, e.g. to restrict an administration view.
+        """
         super(Administration, self).__init__()
+        self.action = action or administration_access_action
 
     def needs(self, **kwargs):
         """Enabling Needs."""
-        return [administration_access_action]
+        return [self.action]
+
+    def query_filter(self, identity=None, **kwargs):
+        """Match all documents if the identity is allowed the action, none otherwise.
+
+        The action is expanded once per request and identity, see
+        :func:`invenio_administration.permissions.compile_permission`.
+        """
+        if identity is not None and compile_permission([self]).allows(identity):
+            return dsl.Q("match_all")
+        return ~dsl.Q("match_all")
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Lightweight view metadata to register views without importing them."""
+
+from flask_babelex import lazy_gettext
+from speaklater import is_lazy_string
+
+
+def _dump_text(value):
+    """Serialize a possibly lazy translated text."""
+    if is_lazy_string(value):
+        # keep the message id, to translate it when rendered
+        return {"msgid": value._args[0]}
+    return value
+
+
+def _load_text(value):
+    """Deserialize a text serialized with :func:`_dump_text`."""
+    if isinstance(value, dict):
+        return lazy_gettext(value["msgid"])
+    return value
+
+
+def dump_view_metadata(view_instance, in_menu):
+    """Serialize the metadata registering a view's URL rule and menu entry.
+
+    :param view_instance: instance of the registered view.
+    :param in_menu: whether the view has a menu entry.
+    """
+    return {
+        "name": view_instance.name,
+        "url": view_instance.url,
+        "category": _dump_text(view_instance.category),
+        "menu_label": _dump_text(view_instance.menu_label),
+        "order": view_instance.order,
+        "icon": view_instance.icon,
+        "in_menu": in_menu,
+        "restricted": view_instance.permission_generators is not None,
+        "methods": sorted(type(view_instance).methods or ()),
+    }
+
+
+class LazyView:
+    """Stand-in of a view not imported yet, built from its metadata.
+
+    Provides the attributes the administration menu reads from views.
+    """
+
+    def __init__(self, metadata, admin):
+        """Constructor."""
+        self.name = metadata["name"]
+        self.url = metadata["url"]
+        self.category = _load_text(metadata["category"])
+        self.menu_label = _load_text(metadata["menu_label"])
+        self.order = metadata["order"]
+        self.icon = metadata["icon"]
+        self.in_menu = metadata["in_menu"]
+        # metadata cached by earlier versions did not record it
+        self.restricted = metadata.get("restricted", True)
+        self.methods = metadata.get("methods")
+        self.endpoint = f"{admin.endpoint}.{self.name}"
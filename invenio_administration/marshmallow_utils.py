@@ -8,6 +8,10 @@
 
 """Invenio administration marshmallow utils module."""
 
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
 from invenio_vocabularies.services.schema import (
     BaseVocabularySchema,
     ContribVocabularyRelationSchema,
@@ -16,6 +20,12 @@ from invenio_vocabularies.services.schema import (
 from marshmallow import fields
 from marshmallow_utils import fields as invenio_fields
 
+from invenio_administration.errors import (
+    RecursiveSchema,
+    SchemaMaxDepthExceeded,
+    UnrecognisedSchemaField,
+)
+
 vocabulary_schemas = [ContribVocabularyRelationSchema, BaseVocabularySchema,
                       VocabularyRelationSchema]
 
@@ -45,63 +55,389 @@ custom_mapping = {
 }
 
 
-def jsonify_schema(schema):
-    """Marshmallow schema to dict."""
-    schema_dict = {}
+@lru_cache(maxsize=None)
+def _is_vocabulary_schema(schema_cls):
+    """Whether the schema class is one of the vocabulary schemas."""
+    return issubclass(schema_cls, tuple(vocabulary_schemas))
 
-    for field, field_type in schema.fields.items():
-        is_links = isinstance(field_type, invenio_fields.links.Links)
 
-        if is_links:
-            continue
+def _skip_field(serializer, field, depth):
+    """Fields left out of the serialized schema."""
+    return None
 
-        is_read_only = field_type.dump_only
-        is_create_only = field_type.metadata["create_only"] \
-            if "create_only" in field_type.metadata else False
 
-        field_type_name = field_type.__class__
-        is_required = field_type.required
+def _nested_field(serializer, field, depth):
+    """Serialize a nested field."""
+    if _is_vocabulary_schema(field.schema.__class__):
+        schema_type = "vocabulary"
+    else:
+        schema_type = "object"
+    return {
+        "type": schema_type,
+        **serializer.nested(field.schema, depth + 1, field.name),
+    }
 
-        nested_field = isinstance(field_type, fields.Nested)
-        list_field = isinstance(field_type, fields.List)
 
-        schema_dict[field] = {
-            "required": is_required,
-            "readOnly": is_read_only,
-            "title": field_type.metadata[
-                "title"] if "title" in field_type.metadata else None,
-            "createOnly": is_create_only,
-            "metadata": field_type.metadata
+def _list_field(serializer, field, depth):
+    """Serialize a list field."""
+    inner = field.inner
+    if isinstance(inner, fields.Nested):
+        # list of objects (vocabularies or nested)
+        items = {
+            "type": "object",
+            **serializer.nested(inner.schema, depth + 1, field.name),
         }
+    else:
+        # list of plain types
+        items = serializer.field_types.resolve(inner.__class__, field.name)(
+            serializer, inner, depth
+        )
+    return {"type": "array", "items": items}
+
+
+class FieldTypeRegistry:
+    """Dispatches marshmallow field classes to their serializer.
+
+    Field classes are registered either with a type name or with a serializer
+    callable taking the schema serializer, the field and its nesting depth. A
+    field class resolves to the registration of the closest class in its MRO,
+    so subclasses of registered fields are supported. Resolutions are
+    memoized per field class.
+    """
+
+    def __init__(self, mapping=None):
+        """Constructor."""
+        self._registrations = dict(mapping or {})
+        self._resolved = {}
+
+    def register(self, field_cls, serializer):
+        """Register a field class.
+
+        :param field_cls: marshmallow field class.
+        :param serializer: type name or serializer callable.
+        """
+        self._registrations[field_cls] = serializer
+        self._resolved.clear()
+
+    def resolve(self, field_cls, field_name=None):
+        """Get the serializer callable of a field class.
+
+        :param field_name: name of the field being serialized, reported when
+            its class is not registered.
+        """
+        try:
+            return self._resolved[field_cls]
+        except KeyError:
+            pass
+
+        for cls in field_cls.__mro__:
+            registration = self._registrations.get(cls)
+            if registration is not None:
+                break
+        else:
+            raise UnrecognisedSchemaField(field_cls.__name__, field_name)
+
+        if callable(registration):
+            serializer = registration
+        else:
+
+            def serializer(schema_serializer, field, depth, type_name=registration):
+                return {"type": type_name}
+
+        self._resolved[field_cls] = serializer
+        return serializer
+
+    def load_entry_points(self, entry_points):
+        """Load field registrations from entry points.
 
-        if nested_field:
-            if any([isinstance(field_type.schema, x) for x in vocabulary_schemas]):
-                schema_type = "vocabulary"
+        Entry points resolve to a mapping of field classes to type names or
+        serializers, or to a callable receiving this registry.
+        """
+        for ep in entry_points:
+            registrations = ep.load()
+            if callable(registrations):
+                registrations(self)
             else:
-                schema_type = "object"
-
-            schema_dict[field].update({
-                "type": schema_type,
-                "properties": jsonify_schema(field_type.schema),
-            })
-        elif list_field and isinstance(field_type.inner, fields.Nested):
-            # list of objects (vocabularies or nested)
-            schema_dict[field].update({
-                "type": "array",
-                "items": {"type": "object",
-                          "properties": jsonify_schema(field_type.inner.schema)},
-            })
-        elif list_field and not isinstance(field_type.inner, fields.Nested):
-            # list of plain types
-            schema_dict[field].update({
-                "type": "array",
-                "items": {"type": custom_mapping[field_type.inner]},
-            })
+                for field_cls, serializer in registrations.items():
+                    self.register(field_cls, serializer)
+
+
+def create_field_types():
+    """Create a registry of the default field serializers."""
+    registry = FieldTypeRegistry(custom_mapping)
+    registry.register(fields.Nested, _nested_field)
+    registry.register(fields.List, _list_field)
+    registry.register(invenio_fields.links.Links, _skip_field)
+    return registry
+
+
+default_field_types = create_field_types()
+"""Field serializers used when no registry is given to :func:`jsonify_schema`."""
+
+
+def jsonify_schema(
+    schema, refs=False, max_depth=None, projection=None, field_types=None
+):
+    """Marshmallow schema to dict.
+
+    :param schema: marshmallow schema instance.
+    :param refs: emit each distinct nested schema once in a ``$defs`` table,
+        referenced with ``$ref`` from every field using it. Recursive schemas
+        can only be serialized in this mode.
+    :param max_depth: maximum nesting depth of the serialized subschemas.
+    :param projection: dotted field paths to serialize, e.g.
+        ``{"id", "metadata.title"}``. A path selects the whole subtree of the
+        field and its parents. All fields are serialized when not given.
+    :param field_types: :class:`FieldTypeRegistry` of the field serializers,
+        defaults to :data:`default_field_types`.
+    """
+    serializer = _SchemaSerializer(
+        field_types or default_field_types, refs=refs, max_depth=max_depth
+    )
+    return serializer.serialize(schema, projection)
+
+
+def _project(projection, field_name):
+    """Get the projection of a field's subtree.
+
+    Returns ``None`` when the whole subtree is selected.
+    """
+    subpaths = set()
+    prefix = f"{field_name}."
+    for path in projection:
+        if path == field_name:
+            return None
+        if path.startswith(prefix):
+            subpaths.add(path[len(prefix):])
+    return frozenset(subpaths)
+
+
+class _SchemaSerializer:
+    """Serializes a marshmallow schema and its nested subschemas."""
+
+    def __init__(self, field_types, refs=False, max_depth=None):
+        """Constructor."""
+        self.field_types = field_types
+        self.refs = refs
+        self.max_depth = max_depth
+        self.definitions = {}
+        self._names = {}
+        self._stack = []
+        self._projections = [None]
+
+    @staticmethod
+    def _key(schema, projection):
+        only = frozenset(schema.only) if schema.only is not None else None
+        exclude = frozenset(schema.exclude) if schema.exclude else None
+        return schema.__class__, only, exclude, projection
+
+    def serialize(self, schema, projection=None):
+        """Serialize the root schema."""
+        if projection is not None:
+            projection = frozenset(projection)
+
+        if not self.refs:
+            return self._fields(schema, 0, projection)
+
+        key = self._key(schema, projection)
+        return {
+            "$ref": f"#/$defs/{self._define(schema, 0, key, projection)}",
+            "$defs": self.definitions,
+        }
+
+    def _define(self, schema, depth, key, projection):
+        """Add the schema to the definitions table, returning its name."""
+        name = self._names.get(key)
+        if name is not None:
+            return name
+
+        # only new definitions nest deeper, references to defined ones do not
+        self._check_depth(schema, depth)
+        name = base_name = schema.__class__.__name__
+        suffix = 1
+        while name in self.definitions:
+            suffix += 1
+            name = f"{base_name}{suffix}"
+        # registered before recursing, so cycles resolve to this definition
+        self._names[key] = name
+        self.definitions[name] = {}
+        self.definitions[name] = self._fields(schema, depth, projection)
+        return name
+
+    def nested(self, schema, depth, field_name=None):
+        """Serialize a nested schema at its use site.
+
+        :param field_name: name of the field holding the nested schema, used to
+            project the nested schema.
+        """
+        projection = self._projections[-1]
+        if projection is not None and field_name is not None:
+            projection = _project(projection, field_name)
         else:
+            projection = None
+
+        key = self._key(schema, projection)
+        if self.refs:
+            return {"$ref": f"#/$defs/{self._define(schema, depth, key, projection)}"}
+
+        self._check_depth(schema, depth)
+        # projections aside, a schema nested in itself is a cycle
+        schema_key = key[:3]
+        if schema_key in self._stack:
+            raise RecursiveSchema(schema.__class__.__name__)
+        self._stack.append(schema_key)
+        try:
+            return {"properties": self._fields(schema, depth, projection)}
+        finally:
+            self._stack.pop()
+
+    def _check_depth(self, schema, depth):
+        """Check a nested schema does not exceed the maximum depth."""
+        if self.max_depth is not None and depth > self.max_depth:
+            raise SchemaMaxDepthExceeded(schema.__class__.__name__, self.max_depth)
+
+    def _fields(self, schema, depth, projection=None):
+        """Serialize the fields of a schema."""
+        schema_dict = {}
+        if projection is not None:
+            selected = {path.split(".", 1)[0] for path in projection}
+
+        self._projections.append(projection)
+        try:
+            for field, field_type in schema.fields.items():
+                if projection is not None and field not in selected:
+                    continue
+
+                serialized_field = self._field(field_type, depth)
+                if serialized_field is not None:
+                    schema_dict[field] = serialized_field
+        finally:
+            self._projections.pop()
+        return schema_dict
+
+    def _field(self, field_type, depth):
+        """Serialize a field, ``None`` if the field is left out."""
+        serialized_type = self.field_types.resolve(
+            field_type.__class__, field_type.name
+        )(self, field_type, depth)
+        if serialized_type is None:
+            return None
+
+        metadata = field_type.metadata
+        return {
+            "required": field_type.required,
+            "readOnly": field_type.dump_only,
+            "title": metadata.get("title"),
+            "createOnly": metadata.get("create_only", False),
+            "metadata": metadata,
+            **serialized_type,
+        }
+
+
+def _freeze(value):
+    """Hashable equivalent of a schema option value, ``None`` if unset."""
+    if not value:
+        # unset options (None, False, empty collections) share the default key
+        return None
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+class SchemaJSONCache:
+    """Bounded LRU cache of serialized marshmallow schemas.
+
+    Entries are keyed by the schema class together with the instance options
+    (``only``, ``exclude``, ``dump_only``, ``load_only``, ``partial`` and
+    ``context``) and the keyword arguments passed to :func:`jsonify_schema`,
+    since these are the only inputs that change the output. Instances whose
+    options cannot be hashed are serialized without caching. The cached
+    dictionaries are shared, callers must not mutate them.
+    """
+
+    instance_options = ("only", "exclude", "dump_only", "load_only", "partial")
+
+    def __init__(self, maxsize=256, field_types=None):
+        """Constructor.
+
+        :param maxsize: maximum number of cached schemas.
+        :param field_types: :class:`FieldTypeRegistry` passed to
+            :func:`jsonify_schema`.
+        """
+        self.maxsize = maxsize
+        self.field_types = field_types
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of cached schemas."""
+        return len(self._entries)
+
+    @classmethod
+    def make_key(cls, schema, **kwargs):
+        """Build the cache key of a schema class or instance.
+
+        :returns: the key, or ``None`` if the schema options are not hashable.
+        """
+        if isinstance(schema, type):
+            options = (None,) * (len(cls.instance_options) + 1)
+            return (schema, options, tuple(sorted(kwargs.items())))
+
+        options = tuple(
+            _freeze(getattr(schema, option, None)) for option in cls.instance_options
+        ) + (_freeze(schema.context),)
+        if schema.only is not None and not schema.only:
+            # an empty ``only`` selects no fields, unlike an unset one
+            options = (frozenset(),) + options[1:]
+        key = (schema.__class__, options, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, schema, **kwargs):
+        """Return the serialized schema, computing it on a cache miss.
+
+        :param schema: marshmallow schema class or instance. Classes are only
+            instantiated when the schema is not cached yet.
+        :param kwargs: keyword arguments passed to :func:`jsonify_schema`.
+        """
+        key = self.make_key(schema, **kwargs)
+        if key is None:
+            return jsonify_schema(schema, field_types=self.field_types, **kwargs)
+
+        with self._lock:
             try:
-                schema_dict[field].update({
-                    "type": custom_mapping[field_type_name],
-                })
+                self._entries.move_to_end(key)
+                return self._entries[key]
             except KeyError:
-                raise Exception(f"Unrecognised schema field {field}: {field_type_name}")
-    return schema_dict
+                pass
+
+        if isinstance(schema, type):
+            schema = schema()
+        value = jsonify_schema(schema, field_types=self.field_types, **kwargs)
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, schema=None):
+        """Drop cached entries.
+
+        :param schema: schema class or instance to invalidate, all entries are
+            dropped when not given.
+        """
+        with self._lock:
+            if schema is None:
+                self._entries.clear()
+                return
+
+            schema_cls = schema if isinstance(schema, type) else schema.__class__
+            for key in [k for k in self._entries if k[0] is schema_cls]:
+                del self._entries[key]
@@ -9,21 +9,38 @@
 """Invenio Administration menu module."""
 
 import urllib.parse
+from functools import partial
 
-from flask import request
+from flask import current_app, g, request
 from flask_babelex import lazy_gettext as _
 from invenio_theme.proxies import current_theme_icons
 from speaklater import make_lazy_string
 
 from invenio_administration.permissions import administration_permission
 
+_ENDPOINT = object()
+"""Key of the menu item endpoint in the nodes of the URL rules trie."""
+
+
+def _rule_segments(rule):
+    return rule.strip("/").split("/")
+
 
 class AdminMenu:
     """Main class for the admin menu."""
 
-    def __init__(self):
-        """Constructor."""
+    def __init__(self, permission_resolver=None):
+        """Constructor.
+
+        :param permission_resolver: callable returning the permission of a
+            menu item's view by its name, ``None`` if not restricted.
+        """
+        self.permission_resolver = permission_resolver
         self._menu_items = []
+        self._exact_endpoints = frozenset()
+        self._rules_trie = {}
+        self._active_endpoints = {}
+        self._custom_active_entries = []
 
     @property
     def items(self):
@@ -33,6 +50,11 @@ class AdminMenu:
     def register_menu_entries(self, flask_menu_instance, menu_key="admin_navigation"):
         """Register all menu items to a flask menu instance."""
         main_menu = flask_menu_instance.submenu(menu_key)
+        self.compile_active_matcher(current_app.url_map)
+        self._custom_active_entries = []
+
+        def is_active(menu_entry):
+            return menu_entry._endpoint in self.get_active_endpoints()
 
         # items without category go first and the rest are sorted alphabetically
         ordered_menu_items = sorted(
@@ -51,22 +73,23 @@ class AdminMenu:
 
             if category:
                 category_menu = main_menu.submenu(category)
-                category_menu.register(text=category)
-                category_menu.submenu(name).register(
-                    endpoint=endpoint,
-                    text=label,
-                    order=order,
-                    active_when=active_when or self.sub_content_active_when,
-                    icon=icon,
+                category_menu.register(
+                    text=category,
+                    visible_when=partial(self.is_category_visible, category),
                 )
+                entry = category_menu.submenu(name)
             else:
-                main_menu.submenu(name).register(
-                    endpoint=endpoint,
-                    text=label,
-                    order=order,
-                    active_when=active_when or self.default_active_when,
-                    icon=icon,
-                )
+                entry = main_menu.submenu(name)
+            entry.register(
+                endpoint=endpoint,
+                text=label,
+                order=order,
+                active_when=active_when or is_active,
+                visible_when=partial(self.is_visible, name),
+                icon=icon,
+            )
+            if active_when:
+                self._custom_active_entries.append((name, entry))
 
     def register_admin_entry(self, current_menu, endpoint):
         """Register administration entry as the last one."""
@@ -106,6 +129,112 @@ class AdminMenu:
 
         self.add_menu_item(menu_item, index)
 
+    def compile_active_matcher(self, url_map):
+        """Index the menu items to resolve the active ones in a single lookup.
+
+        Items without category are active on their own endpoint, items in a
+        category also on the pages under their URL (e.g. a list view's item
+        on its details pages), resolved by the longest matching rule prefix.
+        """
+        exact_endpoints = set()
+        rules_trie = {}
+        for item in self._menu_items:
+            if item.active_when:
+                continue
+            if not item.category:
+                exact_endpoints.add(item.endpoint)
+                continue
+            try:
+                rules = list(url_map.iter_rules(item.endpoint))
+            except KeyError:
+                continue
+            for rule in rules:
+                node = rules_trie
+                for segment in _rule_segments(rule.rule):
+                    node = node.setdefault(segment, {})
+                node[_ENDPOINT] = item.endpoint
+
+        self._exact_endpoints = frozenset(exact_endpoints)
+        self._rules_trie = rules_trie
+        self._active_endpoints = {}
+
+    def get_active_endpoints(self):
+        """Get the endpoints of the menu items active for the current request.
+
+        Resolved once per URL rule and endpoint.
+        """
+        url_rule = request.url_rule
+        rule = url_rule.rule if url_rule is not None else None
+        key = (request.endpoint, rule)
+        active = self._active_endpoints.get(key)
+        if active is None:
+            active = set()
+            if request.endpoint in self._exact_endpoints:
+                active.add(request.endpoint)
+            if rule is not None:
+                node = self._rules_trie
+                prefix_endpoint = None
+                for segment in _rule_segments(rule):
+                    node = node.get(segment)
+                    if node is None:
+                        break
+                    prefix_endpoint = node.get(_ENDPOINT, prefix_endpoint)
+                if prefix_endpoint is not None:
+                    active.add(prefix_endpoint)
+            active = frozenset(active)
+            self._active_endpoints[key] = active
+        return active
+
+    def get_custom_active_names(self):
+        """Get the names of the active menu items with a custom ``active_when``.
+
+        Their conditions may depend on anything in the request, they are
+        evaluated on each call.
+        """
+        return frozenset(
+            name for name, entry in self._custom_active_entries if entry.active
+        )
+
+    def get_visible_names(self):
+        """Get the names of the menu items visible to the current identity.
+
+        Decided in one batch per request and identity, each distinct view
+        permission is evaluated once.
+        """
+        identity = getattr(g, "identity", None)
+        cached = g.get("_administration_visible_menu")
+        if cached is not None and cached[0] is identity:
+            return cached[1]
+
+        decisions = {}
+        visible = set()
+        for item in self._menu_items:
+            permission = None
+            if self.permission_resolver is not None:
+                permission = self.permission_resolver(item.name)
+            if permission is not None:
+                if permission not in decisions:
+                    decisions[permission] = permission.can()
+                if not decisions[permission]:
+                    continue
+            visible.add(item.name)
+        visible = frozenset(visible)
+        g._administration_visible_menu = (identity, visible)
+        return visible
+
+    def is_visible(self, name):
+        """Whether a menu item is visible to the current identity."""
+        return name in self.get_visible_names()
+
+    def is_category_visible(self, category):
+        """Whether a category has menu items visible to the current identity."""
+        visible = self.get_visible_names()
+        return any(
+            item.name in visible
+            for item in self._menu_items
+            if item.category == category
+        )
+
     @staticmethod
     def default_active_when(self):
         """Default condition for the menu item active state."""
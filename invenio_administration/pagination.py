@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Cursor pagination of the list views.
+
+A cursor is the opaque encoding of the sort values of the last hit of a page,
+the next page is searched after them.
+"""
+
+import base64
+
+from flask import json
+
+from .errors import InvalidCursor
+
+
+def encode_cursor(sort_values):
+    """Encode the sort values of a hit into a cursor."""
+    body = json.dumps(list(sort_values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(body.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into the sort values to search after.
+
+    :raises InvalidCursor: if the cursor was not encoded by
+        :func:`encode_cursor`.
+    """
+    try:
+        sort_values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except ValueError as e:
+        raise InvalidCursor(cursor) from e
+    if not isinstance(sort_values, list):
+        raise InvalidCursor(cursor)
+    return sort_values
@@ -8,8 +8,68 @@
 
 """Permissions for administration module."""
 
+from itertools import chain
+
+from flask import g, has_request_context
 from invenio_access import action_factory
 from invenio_access.permissions import Permission
 
+
+class RequestCachedPermission(Permission):
+    """Permission deciding at most once per request and identity.
+
+    Saves expanding the permission's action needs, possibly from the
+    database, on each check: view decorators, menus and templates share the
+    decision. Decisions are dropped when the identity is loaded again, see
+    :func:`clear_permission_decisions`.
+    """
+
+    def allows(self, identity):
+        """Whether the identity can access this permission."""
+        if not has_request_context():
+            return super().allows(identity)
+
+        decisions = g.setdefault("_administration_permission_decisions", {})
+        key = (self, identity)
+        decision = decisions.get(key)
+        if decision is None:
+            decision = decisions[key] = super().allows(identity)
+        return decision
+
+
+def clear_permission_decisions(sender=None, **kwargs):
+    """Drop the permission decisions of the current request.
+
+    Connected to the ``identity_loaded`` signal, sent when the identity is
+    loaded or changed.
+    """
+    if has_request_context():
+        g.pop("_administration_permission_decisions", None)
+
+
+_compiled_permissions = {}
+
+
+def compile_permission(generators):
+    """Compile permission generators into a request cached permission.
+
+    The generators' needs and excludes are generated once, without record.
+    Permissions are interned by need sets, so that views with the same needs
+    share their decisions.
+
+    :param generators: iterable of
+        :class:`invenio_records_permissions.generators.Generator`.
+    """
+    needs = frozenset(chain.from_iterable(gen.needs() for gen in generators))
+    excludes = frozenset(chain.from_iterable(gen.excludes() for gen in generators))
+    key = (needs, excludes)
+    permission = _compiled_permissions.get(key)
+    if permission is None:
+        permission = RequestCachedPermission(*needs)
+        permission.explicit_excludes.update(excludes)
+        permission = _compiled_permissions.setdefault(key, permission)
+    return permission
+
+
 administration_access_action = action_factory("administration-access")
-administration_permission = Permission(administration_access_action)
+administration_permission = RequestCachedPermission(administration_access_action)
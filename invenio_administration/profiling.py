@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Startup profiling of the administration views."""
+
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+STAGES = ("import", "instantiate", "as_view", "add_view")
+"""Stages of a view's registration, in order."""
+
+
+class ViewProfile(namedtuple("ViewProfile", ["name", "timings", "memory"])):
+    """Startup profile of a view.
+
+    ``timings`` and ``memory`` map the registration stages to the time spent,
+    in seconds, and the memory allocated, in bytes.
+    """
+
+    __slots__ = ()
+
+    @property
+    def total_time(self):
+        """Time spent registering the view, in seconds."""
+        return sum(self.timings.values())
+
+    @property
+    def total_memory(self):
+        """Memory allocated registering the view, in bytes."""
+        return sum(self.memory.values())
+
+
+class _Sample:
+    """Measure of a registration stage, attributed to a view by name."""
+
+    def __init__(self):
+        self.view = None
+
+
+class StartupProfiler:
+    """Records the time and memory each view takes to register.
+
+    Memory is traced with :mod:`tracemalloc`, started on creation if not
+    already tracing and stopped by :meth:`stop`.
+    """
+
+    def __init__(self, enabled=True):
+        """Constructor."""
+        self.enabled = enabled
+        self._profiles = {}
+        self._started_tracing = False
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def measure(self, stage, view=None):
+        """Measure a registration stage of a view.
+
+        :param stage: one of :data:`STAGES`.
+        :param view: name of the view, can be set on the yielded sample when
+            only known within the block (e.g. once its entry point is loaded).
+        """
+        sample = _Sample()
+        sample.view = view
+        if not self.enabled:
+            yield sample
+            return
+
+        memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield sample
+        elapsed = time.perf_counter() - start
+        allocated = tracemalloc.get_traced_memory()[0] - memory
+        if sample.view is not None:
+            profile = self._profiles.setdefault(
+                sample.view, ViewProfile(sample.view, {}, {})
+            )
+            profile.timings[stage] = profile.timings.get(stage, 0) + elapsed
+            profile.memory[stage] = profile.memory.get(stage, 0) + allocated
+
+    def stop(self):
+        """Stop profiling, and tracing memory if started by the profiler."""
+        self.enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self):
+        """Get the view profiles, slowest first."""
+        return sorted(self._profiles.values(), key=lambda p: -p.total_time)
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Proxies for accessing the currently instantiated administration extension."""
+
+from flask import current_app
+from werkzeug.local import LocalProxy
+
+current_administration = LocalProxy(
+    lambda: current_app.extensions["invenio-administration"]
+)
+"""Proxy for the instantiated administration extension."""
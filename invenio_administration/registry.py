@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration view registry."""
+
+from speaklater import is_lazy_string
+
+
+def _category_key(category):
+    """Index lazy translated categories by their message id."""
+    if is_lazy_string(category):
+        return category._args[0]
+    return category
+
+
+class ViewRegistry:
+    """Registered admin views, indexed for constant time lookups.
+
+    Views are indexed by name, endpoint, category and resource
+    configuration. The registry is available in templates as
+    ``administration_views``.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._views = []
+        self._by_name = {}
+        self._functions = {}
+        self._by_endpoint = {}
+        self._by_category = {}
+        self._by_resource_config = {}
+
+    def add(self, view, view_instance):
+        """Add a view.
+
+        :param view: view function, as returned by ``as_view``.
+        :param view_instance: instance of the view.
+        """
+        name = view.view_class.name
+        if name in self._by_name:
+            raise ValueError(f"View name already registered: {name}")
+
+        self._views.append(view)
+        self._by_name[name] = view_instance
+        self._functions[name] = view
+        self._by_endpoint[view_instance.endpoint] = view_instance
+        self._by_category.setdefault(_category_key(view_instance.category), []).append(
+            view_instance
+        )
+        resource_config = getattr(view_instance, "resource_config", None)
+        if resource_config is not None:
+            self._by_resource_config.setdefault(resource_config, []).append(
+                view_instance
+            )
+
+    @property
+    def views(self):
+        """View functions, in registration order."""
+        return self._views
+
+    def __contains__(self, name):
+        """Whether a view is registered with the given name."""
+        return name in self._by_name
+
+    def __iter__(self):
+        """Iterate over the view instances, in registration order."""
+        return iter(self._by_name.values())
+
+    def __len__(self):
+        """Number of registered views."""
+        return len(self._by_name)
+
+    def get(self, name):
+        """Get a view instance by its name, ``None`` if not registered."""
+        return self._by_name.get(name)
+
+    def get_view_function(self, name):
+        """Get a view function by its view's name, ``None`` if not registered."""
+        return self._functions.get(name)
+
+    def get_by_endpoint(self, endpoint):
+        """Get a view instance by its endpoint, e.g. ``administration.mock``."""
+        return self._by_endpoint.get(endpoint)
+
+    def get_by_category(self, category):
+        """Get the view instances of a menu category, ``None`` for no category."""
+        return tuple(self._by_category.get(_category_key(category), ()))
+
+    def get_by_resource_config(self, resource_config):
+        """Get the view instances of a resource, by its ``resource_config``."""
+        return tuple(self._by_resource_config.get(resource_config, ()))
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Serialized schema documents served to the administration frontend."""
+
+import glob
+import hashlib
+import os
+from collections import namedtuple
+
+from flask import json
+from werkzeug.utils import secure_filename
+
+from .discovery import environment_fingerprint
+
+SchemaDocument = namedtuple("SchemaDocument", ["data", "body", "etag"])
+"""Serialized schema payload of a view, with its JSON body and content hash."""
+
+
+def build_schema_document(data):
+    """Build a schema document from a view's schema payload."""
+    body = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    etag = hashlib.sha1(body.encode("utf-8")).hexdigest()
+    return SchemaDocument(data, body, etag)
+
+
+FINGERPRINT_CONFIG = (
+    "ADMINISTRATION_SCHEMA_REFS",
+    "ADMINISTRATION_SCHEMA_MAX_DEPTH",
+    "ADMINISTRATION_SCHEMA_PROJECTION",
+)
+"""Configuration variables changing the serialized schema documents."""
+
+
+def schema_fingerprint(config):
+    """Fingerprint of what the serialized schema documents depend on.
+
+    Schemas are defined by the installed packages, identified with the
+    stat-based :func:`~invenio_administration.discovery.environment_fingerprint`
+    rather than by reading the metadata of every distribution, and their
+    serialization by the configuration listed in :data:`FINGERPRINT_CONFIG`.
+    """
+    settings = {key: config.get(key) for key in FINGERPRINT_CONFIG}
+    data = json.dumps(
+        {"environment": environment_fingerprint(), "config": settings},
+        sort_keys=True,
+    )
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class SchemaArtifacts:
+    """Precompiled schema documents stored as content-hashed JSON files.
+
+    A manifest maps each view name to its artifact, together with the locale
+    and the fingerprint the documents were compiled with. Loading an artifact
+    does not need the view's resource nor its marshmallow schemas.
+    """
+
+    manifest_filename = "manifest.json"
+
+    def __init__(self, path, fingerprint=None):
+        """Constructor.
+
+        :param path: directory holding the artifacts.
+        :param fingerprint: callable returning the fingerprint of the current
+            environment, see :func:`schema_fingerprint`. Artifacts compiled
+            with another fingerprint are ignored.
+        """
+        self.path = path
+        self._fingerprint_func = fingerprint
+        self._fingerprint = None
+        self._manifest = None
+
+    @property
+    def fingerprint(self):
+        """Fingerprint of the current environment, computed once."""
+        if self._fingerprint is None and self._fingerprint_func is not None:
+            self._fingerprint = self._fingerprint_func()
+        return self._fingerprint
+
+    @property
+    def manifest(self):
+        """Compiled manifest, empty if no artifacts were compiled."""
+        if self._manifest is None:
+            try:
+                with open(os.path.join(self.path, self.manifest_filename)) as fp:
+                    self._manifest = json.load(fp)
+            except FileNotFoundError:
+                self._manifest = {}
+        return self._manifest
+
+    def load(self, name, locale=None):
+        """Load the precompiled document of a view.
+
+        :returns: a :class:`SchemaDocument` or ``None`` if there is no artifact
+            for the view compiled with the given locale and the current
+            fingerprint.
+        """
+        if self.manifest.get("locale") != locale:
+            return None
+        if self.manifest.get("fingerprint") != self.fingerprint:
+            return None
+        filename = self.manifest.get("views", {}).get(name)
+        if filename is None:
+            return None
+
+        try:
+            with open(os.path.join(self.path, filename)) as fp:
+                body = fp.read()
+        except FileNotFoundError:
+            return None
+        etag = filename.rsplit(".", 2)[-2]
+        return SchemaDocument(json.loads(body), body, etag)
+
+    def write(self, documents, locale=None):
+        """Write the documents and replace the manifest.
+
+        Artifacts not referenced by the new manifest are removed.
+
+        :param documents: dictionary of view names to :class:`SchemaDocument`.
+        :param locale: locale the documents were built with.
+        :returns: the written manifest.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        views = {}
+        for name, document in documents.items():
+            filename = f"{secure_filename(name)}.{document.etag}.json"
+            with open(os.path.join(self.path, filename), "w") as fp:
+                fp.write(document.body)
+            views[name] = filename
+
+        manifest = {
+            "locale": locale,
+            "fingerprint": self.fingerprint,
+            "views": views,
+        }
+        manifest_path = os.path.join(self.path, self.manifest_filename)
+        with open(f"{manifest_path}.tmp", "w") as fp:
+            json.dump(manifest, fp, indent=2, sort_keys=True)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+        keep = set(views.values()) | {self.manifest_filename}
+        for path in glob.glob(os.path.join(self.path, "*.json")):
+            if os.path.basename(path) not in keep:
+                os.remove(path)
+
+        self._manifest = manifest
+        return manifest
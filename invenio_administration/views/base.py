@@ -7,11 +7,19 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """Invenio Administration views base module."""
+import threading
 from functools import partial
+from itertools import chain
+from types import MappingProxyType
 
-from flask import current_app, render_template, url_for
+from flask import abort, current_app, g, render_template, request, url_for
 from flask.views import MethodView
+from invenio_pidstore.errors import PersistentIdentifierError
+from invenio_records.dumpers import SearchDumper
+from invenio_records_resources.services.errors import PermissionDeniedError
 from invenio_search_ui.searchconfig import search_app_config
+from sqlalchemy.orm.exc import NoResultFound
+from werkzeug.http import quote_etag
 
 from invenio_administration.errors import (
     InvalidActionsConfiguration,
@@ -21,8 +29,35 @@ from invenio_administration.errors import (
     MissingExtensionName,
     MissingResourceConfiguration,
 )
-from invenio_administration.marshmallow_utils import jsonify_schema
-from invenio_administration.permissions import administration_permission
+from invenio_administration.export import EXPORT_SERIALIZERS, get_field
+from invenio_administration.pagination import decode_cursor, encode_cursor
+from invenio_administration.permissions import (
+    administration_permission,
+    compile_permission,
+)
+from invenio_administration.proxies import current_administration
+
+_resolve_lock = threading.RLock()
+
+
+class _ResolvedOnce:
+    """Class attribute resolved on first access by a view classmethod.
+
+    The resolved value is stored on the class, shadowing this descriptor, so
+    that later accesses are plain attribute lookups.
+    """
+
+    def __init__(self, resolver):
+        """Constructor.
+
+        :param resolver: name of the classmethod resolving the value.
+        """
+        self.resolver = resolver
+
+    def __get__(self, instance, owner):
+        """Resolve the attribute."""
+        extension_name = getattr(instance, "extension_name", None)
+        return getattr(owner, self.resolver)(extension_name)
 
 
 class AdminView(MethodView):
@@ -39,6 +74,12 @@ class AdminView(MethodView):
 
     decorators = [administration_permission.require(http_exception=403)]
 
+    permission_generators = None
+    """Generators of the view's permission, required in addition to the
+    administration access, e.g. ``[Administration(users_action)]``."""
+
+    _frozen = False
+
     def __init__(
         self,
         name=__name__,
@@ -76,6 +117,66 @@ class AdminView(MethodView):
         if self.get is None:
             raise MissingDefaultGetView(self.__class__.__name__)
 
+    def __setattr__(self, name, value):
+        """Set an attribute, unless the view is shared by requests."""
+        if self._frozen:
+            raise AttributeError(
+                f"Cannot set {name!r} on shared view {self.name!r}, "
+                "keep per-request state in locals or flask.g"
+            )
+        super().__setattr__(name, value)
+
+    def as_shared_view(self):
+        """Get a view function dispatching every request to this instance.
+
+        Unlike :meth:`as_view`, the view is not instantiated, and validated,
+        on each request. The instance is frozen, as it is shared by all
+        requests.
+        """
+        cls = type(self)
+
+        def view(**kwargs):
+            return current_app.ensure_sync(self.dispatch_request)(**kwargs)
+
+        view.__name__ = cls.name
+        view.__module__ = cls.__module__
+        for decorator in cls.decorators:
+            view = decorator(view)
+
+        # same attributes as the view functions created by as_view
+        view.view_class = cls
+        view.__name__ = cls.name
+        view.__doc__ = cls.__doc__
+        view.__module__ = cls.__module__
+        view.methods = cls.methods
+        view.provide_automatic_options = cls.provide_automatic_options
+
+        self._frozen = True
+        return view
+
+    @classmethod
+    def get_permission(cls):
+        """Get the view's permission, ``None`` if not restricted.
+
+        Compiled once per view class, on registration.
+        """
+        try:
+            return cls.__dict__["_compiled_permission"]
+        except KeyError:
+            pass
+        permission = None
+        if cls.permission_generators is not None:
+            permission = compile_permission(cls.permission_generators)
+        cls._compiled_permission = permission
+        return permission
+
+    def dispatch_request(self, **kwargs):
+        """Dispatch the request if allowed by the view's permission."""
+        permission = self.get_permission()
+        if permission is not None and not permission.can():
+            abort(403)
+        return super().dispatch_request(**kwargs)
+
     @property
     def endpoint(self):
         """Get name for endpoint location e.g: 'administration.index'."""
@@ -127,9 +228,9 @@ class AdminResourceBaseView(AdminView):
     display_edit = False
     display_delete = False
     resource_config = None
-    resource = None
+    resource = _ResolvedOnce("resolve_resource")
     actions = {}
-    schema = None
+    schema = _ResolvedOnce("resolve_schema")
     api_endpoint = None
     pid_path = "pid"
     title = None
@@ -139,6 +240,18 @@ class AdminResourceBaseView(AdminView):
     list_view_name = None
     request_headers = {"Accept": "application/json"}
 
+    action_permission_generators = {}
+    """Generators of the permissions of the view's actions, by action name.
+
+    Actions the identity cannot perform are not displayed, e.g. ``"edit"``
+    sets ``display_edit`` to ``False`` and a custom action of :attr:`actions`
+    is listed in ``hidden_actions``.
+    """
+
+    prefetch_record = None
+    """Inline the record in the detail and edit pages, defaults to
+    ``ADMINISTRATION_PREFETCH_RECORD``."""
+
     def __init__(
         self,
         name=__name__,
@@ -167,8 +280,39 @@ class AdminResourceBaseView(AdminView):
         """Set resource."""
         cls.resource = cls._get_resource(extension_name)
 
+    @classmethod
+    def _resolve_once(cls, attr, resolve):
+        """Resolve a class attribute a single time.
+
+        Concurrent first accesses wait for the running resolution and share
+        its result, resolved values are read without locking.
+        """
+        value = cls.__dict__.get(attr)
+        if value is None or isinstance(value, _ResolvedOnce):
+            with _resolve_lock:
+                value = cls.__dict__.get(attr)
+                if value is None or isinstance(value, _ResolvedOnce):
+                    value = resolve()
+                    setattr(cls, attr, value)
+        return value
+
+    @classmethod
+    def resolve_resource(cls, extension_name=None):
+        """Get the view's resource, resolved on first access."""
+        if cls.resource_config is None:
+            return None
+        return cls._resolve_once("resource", lambda: cls._get_resource(extension_name))
+
+    @classmethod
+    def resolve_schema(cls, extension_name=None):
+        """Get the view's service schema, resolved on first access."""
+        return cls._resolve_once("schema", cls.get_service_schema)
+
     @classmethod
     def _get_resource(cls, extension_name=None):
+        if extension_name is None and cls.extension_name is None:
+            # extension name derived from the view's entry point
+            extension_name = current_administration.get_extension_name(cls)
         extension_name = cls._get_view_extension(extension_name)
         try:
             return getattr(extension_name, cls.resource_config)
@@ -176,18 +320,53 @@ class AdminResourceBaseView(AdminView):
             raise InvalidResource(resource=cls.resource_config, view=cls.__name__)
 
     @classmethod
-    def get_service_schema(cls):
-        """Get marshmallow schema of the assigned service."""
+    def get_service_schema_class(cls):
+        """Get marshmallow schema class of the assigned service."""
         # schema.schema due to the schema wrapper imposed,
         # when the actual class needed
-        return cls.resource.service.schema.schema()
+        return cls.resource.service.schema.schema
+
+    @classmethod
+    def get_service_schema(cls):
+        """Get marshmallow schema of the assigned service."""
+        return cls.get_service_schema_class()()
+
+    @classmethod
+    def get_schema_projection(cls):
+        """Get the service schema field paths used by the view.
+
+        Computed once per view class, ``None`` if the view uses the whole
+        schema.
+        """
+        if "_schema_projection" not in cls.__dict__:
+            cls._schema_projection = cls._build_schema_projection()
+        return cls._schema_projection
 
-    def _schema_to_json(self, schema):
+    @classmethod
+    def _build_schema_projection(cls):
+        """Build the service schema field paths used by the view."""
+        return None
+
+    @classmethod
+    def _ui_fields_projection(cls, ui_fields):
+        """Build a schema projection from a UI fields configuration."""
+        if not ui_fields:
+            return None
+        return frozenset([*ui_fields, cls.pid_path, cls.resource_name or cls.pid_path])
+
+    def _schema_to_json(self, schema, projection=None):
         """Translate marshmallow schema to JSON.
 
-        Provides action payload template for the frontend.
+        Provides action payload template for the frontend. The result is
+        cached per schema class, see
+        :class:`invenio_administration.marshmallow_utils.SchemaJSONCache`.
         """
-        return jsonify_schema(schema)
+        return current_administration.schema_cache.get(
+            schema,
+            refs=current_app.config["ADMINISTRATION_SCHEMA_REFS"],
+            max_depth=current_app.config["ADMINISTRATION_SCHEMA_MAX_DEPTH"],
+            projection=projection,
+        )
 
     def get_api_endpoint(self):
         """Get search API endpoint."""
@@ -217,22 +396,135 @@ class AdminResourceBaseView(AdminView):
             serialized_actions[key] = {"text": value["text"], "order": value["order"]}
             if value["payload_schema"] is not None:
                 serialized_actions[key]["payload_schema"] = self._schema_to_json(
-                    value["payload_schema"]()
+                    value["payload_schema"]
                 )
 
         return serialized_actions
 
+    def get_schema_payload(self):
+        """Get the serialized schemas served by the view's schema endpoint.
+
+        The resource schema is projected on the fields the view displays.
+        Actions need no resource schema fields: their forms are generated
+        from their own ``payload_schema``, which is serialized in full.
+        """
+        projection = None
+        if current_app.config["ADMINISTRATION_SCHEMA_PROJECTION"]:
+            projection = self.get_schema_projection()
+        return {
+            "resource_schema": self._schema_to_json(
+                self.get_service_schema_class(), projection
+            ),
+            "actions": self.serialize_actions(),
+        }
+
+    def get_schema_url(self):
+        """Get the URL of the view's schema endpoint, versioned by content hash."""
+        document = self.administration.get_schema_document(self.name)
+        return url_for(
+            f"{self.administration.endpoint}._schema",
+            view_name=self.name,
+            v=document.etag,
+        )
+
+    def get_schema_context(self):
+        """Get the template context referencing the view's schemas.
+
+        The schemas are inlined only if ``ADMINISTRATION_INLINE_SCHEMAS`` is set.
+        """
+        if current_app.config["ADMINISTRATION_INLINE_SCHEMAS"]:
+            return self.administration.get_schema_document(self.name).data
+        return {"schema_url": self.get_schema_url()}
+
+    def get_static_context(self):
+        """Get the template context shared by all requests to the view.
+
+        Built once per locale by :meth:`build_static_context` and frozen,
+        requests only merge their own values (e.g. the ``pid``) into it.
+        """
+        return self.administration.get_static_context(self)
+
+    def build_static_context(self):
+        """Build the template context shared by all requests to the view."""
+        return self.get_schema_context()
+
+    @classmethod
+    def get_action_permission(cls, action):
+        """Get the permission of an action, ``None`` if not restricted."""
+        permissions = cls.__dict__.get("_compiled_action_permissions")
+        if permissions is None:
+            permissions = {
+                name: compile_permission(generators)
+                for name, generators in cls.action_permission_generators.items()
+            }
+            cls._compiled_action_permissions = permissions
+        return permissions.get(action)
+
+    def can_perform(self, action):
+        """Whether the current identity can perform an action of the view."""
+        permission = self.get_action_permission(action)
+        return permission is None or permission.can()
+
+    def get_permissions_context(self):
+        """Get the template context hiding the actions not allowed.
+
+        Custom actions are served by the view's schema document, shared by
+        all identities, so those not allowed are listed in ``hidden_actions``
+        for the frontend to leave out.
+        """
+        context = {}
+        hidden_actions = []
+        for action in self.action_permission_generators:
+            if self.can_perform(action):
+                continue
+            if action in self.actions:
+                hidden_actions.append(action)
+            else:
+                context[f"display_{action}"] = False
+        if hidden_actions:
+            context["hidden_actions"] = hidden_actions
+        return context
+
+    def get_record_context(self, pid_value):
+        """Get the template context inlining the record and its ETag.
+
+        The record is read with the request's identity. The page fetches it
+        from the API when it is not inlined, e.g. if the record does not exist
+        or the identity cannot read it, and reports the error.
+        """
+        prefetch = self.prefetch_record
+        if prefetch is None:
+            prefetch = current_app.config["ADMINISTRATION_PREFETCH_RECORD"]
+        if not prefetch or pid_value is None:
+            return {}
+        try:
+            record = self.resource.service.read(g.identity, pid_value).to_dict()
+        except (PermissionDeniedError, PersistentIdentifierError, NoResultFound):
+            return {}
+        except Exception:
+            # the page requests the record itself and reports the error
+            current_app.logger.exception(
+                "Failed to prefetch %s record %s", self.name, pid_value
+            )
+            return {}
+        revision_id = record.get("revision_id")
+        return {
+            "record": record,
+            # as the record resource's ETag header
+            "record_etag": quote_etag(str(revision_id)) if revision_id else None,
+        }
+
     def get_list_view_endpoint(self):
         """Returns administration UI list view endpoint."""
         if self.list_view_name:
-            return url_for(f"administration.{self.list_view_name}")
+            return url_for(f"{self.administration.endpoint}.{self.list_view_name}")
         if isinstance(self, AdminResourceListView):
-            return url_for(f"administration.{self.name}")
+            return url_for(self.endpoint)
 
     def get_create_view_endpoint(self):
         """Returns administration UI list view endpoint."""
         if self.create_view_name:
-            return url_for(f"administration.{self.create_view_name}")
+            return url_for(f"{self.administration.endpoint}.{self.create_view_name}")
 
 
 class AdminResourceDetailView(AdminResourceBaseView):
@@ -247,24 +539,24 @@ class AdminResourceDetailView(AdminResourceBaseView):
     template = "invenio_administration/details.html"
     title = "Resource details"
 
-    def get_context(self, pid_value=None):
-        """Create details view context."""
+    @classmethod
+    def _build_schema_projection(cls):
+        """Build the service schema field paths used by the view."""
+        return cls._ui_fields_projection(cls.item_field_list)
+
+    def build_static_context(self):
+        """Build the template context shared by all requests to the view."""
         name = self.name
-        schema = self.get_service_schema()
-        serialized_schema = self._schema_to_json(schema)
         fields = self.item_field_list
         return {
-            "request_headers"
+            **super().build_static_context(),
             "name": name,
-            "resource_schema": serialized_schema,
             "fields": fields,
             "exclude_fields": self.item_field_exclude_list,
             "ui_config": self.item_field_list,
-            "pid": pid_value,
             "api_endpoint": self.get_api_endpoint(),
             "title": self.title,
             "list_endpoint": self.get_list_view_endpoint(),
-            "actions": self.serialize_actions(),
             "pid_path": self.pid_path,
             "display_edit": self.display_edit,
             "display_delete": self.display_delete,
@@ -275,6 +567,15 @@ class AdminResourceDetailView(AdminResourceBaseView):
             "request_headers": self.request_headers,
         }
 
+    def get_context(self, pid_value=None):
+        """Create details view context."""
+        return {
+            **self.get_static_context(),
+            **self.get_permissions_context(),
+            **self.get_record_context(pid_value),
+            "pid": pid_value,
+        }
+
     def get(self, pid_value=None):
         """GET view method."""
         return self.render(**self.get_context(pid_value=pid_value))
@@ -286,20 +587,30 @@ class AdminFormView(AdminResourceBaseView):
     form_fields = None
     display_read_only = True
 
+    @classmethod
+    def _build_schema_projection(cls):
+        """Build the service schema field paths used by the view."""
+        return cls._ui_fields_projection(cls.form_fields)
+
+    def build_static_context(self):
+        """Build the template context shared by all requests to the view."""
+        form_fields = self.form_fields
+        return {
+            **super().build_static_context(),
+            "form_fields": form_fields,
+            "api_endpoint": self.get_api_endpoint(),
+            "title": self.title,
+            "list_endpoint": self.get_list_view_endpoint(),
+            "ui_config": self.form_fields,
+        }
+
     def get(self, pid_value=None):
         """GET view method."""
-        schema = self.get_service_schema()
-        serialized_schema = self._schema_to_json(schema)
-        form_fields = self.form_fields
         return self.render(
             **{
-                "resource_schema": serialized_schema,
-                "form_fields": form_fields,
+                **self.get_static_context(),
+                **self.get_record_context(pid_value),
                 "pid": pid_value,
-                "api_endpoint": self.get_api_endpoint(),
-                "title": self.title,
-                "list_endpoint": self.get_list_view_endpoint(),
-                "ui_config": self.form_fields,
             }
         )
 
@@ -343,6 +654,38 @@ class AdminResourceListView(AdminResourceBaseView):
 
     search_request_headers = {"Accept": "application/json"}
 
+    prefetch_search = None
+    """Embed the first page of results in the page, defaults to
+    ``ADMINISTRATION_PREFETCH_SEARCH``."""
+
+    cursor_pagination = False
+    """Page the results with cursors instead of offsets, see
+    :meth:`search_after`."""
+
+    cursor_tiebreaker = "uuid"
+    """Unique field ending the sort of cursor pages, for a stable order."""
+
+    source_filtering = False
+    """Fetch only the fields the view uses from the search engine, see
+    :meth:`get_source_projection`."""
+
+    source_fields = ("id",)
+    """Indexed fields kept by source filtering besides the ones the view uses,
+    by default the records' identifier.
+
+    Custom actions list the fields their links depend on in their own
+    ``source_fields``.
+    """
+
+    export_formats = ("csv", "jsonl")
+    """Formats the results can be exported in, see :meth:`export`."""
+
+    export_fields = None
+    """Fields of the exported rows, defaults to the ``item_field_list`` ones."""
+
+    export_batch_size = 500
+    """Number of results fetched at once by exports."""
+
     def get_search_request_headers(self):
         """Get search request headers."""
         return self.search_request_headers
@@ -360,10 +703,63 @@ class AdminResourceListView(AdminResourceBaseView):
             config_name=self.get_search_app_name(),
             available_facets=current_app.config.get(self.search_facets_config_name),
             sort_options=current_app.config[self.search_sort_config_name],
-            endpoint=self.get_api_endpoint(),
+            endpoint=self.get_search_endpoint(),
             headers=self.get_search_request_headers(),
         )
 
+    def get_search_endpoint(self):
+        """Get the endpoint of the search app.
+
+        Views paging with cursors or filtering the source of the results
+        search through the administration, see :meth:`search`.
+        """
+        if self.cursor_pagination or self.source_filtering:
+            return url_for(
+                f"{self.administration.endpoint}._search", view_name=self.name
+            )
+        return self.get_api_endpoint()
+
+    @classmethod
+    def _build_schema_projection(cls):
+        """Build the service schema field paths used by the view."""
+        return cls._ui_fields_projection(cls.item_field_list)
+
+    def get_source_projection(self):
+        """Get the indexed fields fetched by the view's searches.
+
+        Built once per view class from the fields the view uses: the displayed
+        ones and the ``pid_path`` the links (hence the default actions) are
+        built from, the ``source_fields`` of the custom actions, the model
+        fields the service's records are loaded from and ``source_fields``.
+        ``None`` if the view displays all fields.
+        """
+        cls = type(self)
+        if "_source_projection" not in cls.__dict__:
+            fields = self._ui_fields_projection(self.item_field_list)
+            if fields is not None:
+                fields = sorted(
+                    fields.union(
+                        self.source_fields,
+                        self._model_dump_keys(self.resource.service.record_cls),
+                        *(
+                            action.get("source_fields", ())
+                            for action in self.actions.values()
+                        ),
+                    )
+                )
+            cls._source_projection = fields
+        return cls._source_projection
+
+    @staticmethod
+    def _model_dump_keys(record_cls):
+        """Get the dump keys of the model fields records are loaded from."""
+        dumper = record_cls.dumper
+        if not isinstance(dumper, SearchDumper):
+            return set()
+        keys = {key for key, _ in dumper._model_fields.values()}
+        keys.update(field.dump_key for field in dumper._iter_modelfields(record_cls))
+        return keys
+
     def get_sort_options(self):
         """Get search sort options."""
         if not self.sort_options:
@@ -376,33 +772,184 @@ class AdminResourceListView(AdminResourceBaseView):
             return self.resource.service.config.search.facets
         return self.available_facets
 
+    def build_static_context(self):
+        """Build the template context shared by all requests to the view."""
+        # evaluated once, the template calls ``search_config()``
+        search_conf = self.init_search_config()()
+        return {
+            **super().build_static_context(),
+            "search_config": lambda: search_conf,
+            "api_endpoint": self.get_api_endpoint(),
+            "title": self.title,
+            "name": self.name,
+            "fields": self.item_field_list,
+            "display_search": self.display_search,
+            "display_create": self.display_create,
+            "display_edit": self.display_edit,
+            "display_delete": self.display_delete,
+            "display_read": self.display_read,
+            "display_export": True,
+            "export_urls": self.get_export_urls(),
+            "cursor_pagination": self.cursor_pagination,
+            "pid_path": self.pid_path,
+            "create_ui_endpoint": self.get_create_view_endpoint(),
+            "list_ui_endpoint": self.get_list_view_endpoint(),
+            "resource_name": self.resource_name
+            if self.resource_name
+            else self.pid_path,
+        }
+
+    def prefetch_search_results(self):
+        """Run the search app's initial query, for the app to start from it.
+
+        Only the initial query of pages without query string is known, the
+        results are ``None`` otherwise, if the identity cannot search or if
+        the search fails.
+        """
+        if request.args:
+            return None
+        search_config = self.get_static_context()["search_config"]()
+        initial_state = search_config["initialQueryState"]
+        params = {
+            "q": "",
+            "sort": search_config["defaultSortingOnEmptyQueryString"]["sortBy"],
+            "page": initial_state["page"],
+            "size": initial_state["size"],
+        }
+        try:
+            if self.cursor_pagination or self.source_filtering:
+                return self.search(params)
+            return self.resource.service.search(g.identity, params=params).to_dict()
+        except PermissionDeniedError:
+            return None
+        except Exception:
+            # the search app runs the query itself and reports the error
+            current_app.logger.exception("Failed to prefetch %s results", self.name)
+            return None
+
+    def search(self, params, cursor=None):
+        """Search the results served by the view's administration endpoint.
+
+        Pages with cursors if ``cursor_pagination`` is set, see
+        :meth:`search_after`, and with offsets otherwise. Hits only have the
+        fields of :meth:`get_source_projection` if ``source_filtering`` is
+        set.
+
+        :param params: search parameters of the service.
+        :param cursor: cursor of the previous page, ``None`` for the first.
+        """
+        if self.cursor_pagination:
+            return self.search_after(params, cursor)
+        return self._search(dict(params))[1]
+
+    def search_after(self, params, cursor=None):
+        """Search the page of results following a cursor.
+
+        Pages are searched after the sort values of the previous page's last
+        hit instead of from an offset, so that deep pages cost as much as the
+        first one and are not limited by the search engine's
+        ``max_result_window``. Results have the ``cursor`` of the next page,
+        unless they are the last page.
+
+        :param params: search parameters of the service, the page is ignored.
+        :param cursor: cursor of the previous page, ``None`` for the first.
+        :raises InvalidCursor: if the cursor cannot be decoded.
+        """
+        sort_values = None if cursor is None else decode_cursor(cursor)
+
+        def paginate(search):
+            search = search.sort(
+                *search.to_dict().get("sort", ()), self.cursor_tiebreaker
+            )
+            search = search.extra(track_total_hits=True)
+            if sort_values is not None:
+                search = search.extra(search_after=sort_values)
+            return search
+
+        params = {**params, "page": 1}
+        hits, results = self._search(params, paginate)
+        if len(hits) == params["size"]:
+            results["cursor"] = encode_cursor(hits[-1].meta.sort)
+        return results
+
+    def _search(self, params, paginate=None):
+        """Execute a search of the view's service.
+
+        :param paginate: callable customizing the paging of the search.
+        :returns: the hits and the serialized results.
+        """
+        service = self.resource.service
+        identity = g.identity
+        service.require_permission(identity, "search")
+
+        # built as the service's searches, with its parameters and components
+        search = service._search("search", identity, params, None)
+        if paginate is not None:
+            search = paginate(search)
+        if self.source_filtering:
+            projection = self.get_source_projection()
+            if projection is not None:
+                search = search.source(includes=projection)
+        search_result = search.execute()
+
+        results = service.result_list(
+            service,
+            identity,
+            search_result,
+            params,
+            links_item_tpl=service.links_item_tpl,
+        ).to_dict()
+        return search_result.hits, results
+
+    def get_export_urls(self):
+        """Get the URLs of the view's exports, by format."""
+        return {
+            export_format: url_for(
+                f"{self.administration.endpoint}._export",
+                view_name=self.name,
+                export_format=export_format,
+            )
+            for export_format in self.export_formats
+        }
+
+    def get_export_fields(self):
+        """Get the fields of the exported rows."""
+        if self.export_fields is not None:
+            return list(self.export_fields)
+        fields = self.item_field_list or {}
+        return sorted(fields, key=lambda name: fields[name].get("order", 0))
+
+    def export(self, params, export_format):
+        """Export all the results of a search, one row per result.
+
+        Results are scanned through the service and serialized as they are
+        fetched, so that memory stays constant whatever their number. The
+        search permission is checked and the first batch fetched on call,
+        so that search errors are raised before the first line.
+
+        :param params: search parameters of the service, the paging is
+            ignored.
+        :param export_format: one of ``export_formats``.
+        :returns: an iterator over the lines of the export.
+        """
+        fields = self.get_export_fields()
+        params = {**params, "page": 1, "size": self.export_batch_size}
+        hits = iter(self.resource.service.scan(g.identity, params=params).hits)
+        first = next(hits, None)
+        if first is not None:
+            hits = chain([first], hits)
+        rows = ([get_field(hit, field) for field in fields] for hit in hits)
+        return EXPORT_SERIALIZERS[export_format](fields, rows)
+
     def get(self):
         """GET view method."""
-        search_conf = self.init_search_config()
-        schema = self.get_service_schema()
-        serialized_schema = self._schema_to_json(schema)
-        return self.render(
-            **{
-                "search_config": search_conf,
-                "api_endpoint": self.get_api_endpoint(),
-                "title": self.title,
-                "name": self.name,
-                "resource_schema": serialized_schema,
-                "fields": self.item_field_list,
-                "display_search": self.display_search,
-                "display_create": self.display_create,
-                "display_edit": self.display_edit,
-                "display_delete": self.display_delete,
-                "display_read": self.display_read,
-                "actions": self.serialize_actions(),
-                "pid_path": self.pid_path,
-                "create_ui_endpoint": self.get_create_view_endpoint(),
-                "list_ui_endpoint": self.get_list_view_endpoint(),
-                "resource_name": self.resource_name
-                if self.resource_name
-                else self.pid_path,
-            }
-        )
+        context = {**self.get_static_context(), **self.get_permissions_context()}
+        prefetch = self.prefetch_search
+        if prefetch is None:
+            prefetch = current_app.config["ADMINISTRATION_PREFETCH_SEARCH"]
+        if prefetch:
+            context["prefetched_search"] = self.prefetch_search_results()
+        return self.render(**context)
 
 
 class AdminResourceViewSet:
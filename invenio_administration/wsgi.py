@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""UI + REST WSGI application with warmed up administration views.
+
+Drop-in replacement of :mod:`invenio_app.wsgi`, e.g.
+``gunicorn invenio_administration.wsgi:application``, so that workers serve
+the administration views without resolving them on their first request.
+With ``ADMINISTRATION_PRELOAD`` and ``gunicorn --preload``, the views are
+prepared once in the master and shared copy-on-write by the workers.
+"""
+
+from invenio_app.wsgi import application
+
+if application.config["ADMINISTRATION_PRELOAD"]:
+    report = application.extensions["invenio-administration"].preload(application)
+    application.logger.info(
+        "Preloaded %d administration views, %s bytes shared with the workers",
+        len(report.timings),
+        report.rss_after - report.rss_before if report.rss_before else "unknown",
+    )
+else:
+    application.extensions["invenio-administration"].warmup(application)
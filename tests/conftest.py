@@ -15,6 +15,11 @@ from collections import namedtuple
 
 import pytest
 from flask_security import login_user
+from flask_webpackext.manifest import (
+    JinjaManifest,
+    JinjaManifestEntry,
+    JinjaManifestLoader,
+)
 from invenio_access.models import ActionRoles, Role
 from invenio_access.permissions import superuser_access
 from invenio_accounts.testutils import login_user_via_session
@@ -26,6 +31,8 @@ from mock_module.administration.mock import MockView
 from mock_module.config import ServiceConfig
 from mock_module.resource import MockResource
 
+from invenio_administration.permissions import administration_access_action
+
 
 @pytest.fixture(scope="module")
 def celery_config():
@@ -36,6 +43,41 @@ def celery_config():
     return {}
 
 
+class MockJinjaManifest(JinjaManifest):
+    """Mock manifest."""
+
+    def __getitem__(self, key):
+        """Get a manifest entry."""
+        return JinjaManifestEntry(key, [key])
+
+    def __getattr__(self, name):
+        """Get a manifest entry."""
+        return JinjaManifestEntry(name, [name])
+
+
+class MockManifestLoader(JinjaManifestLoader):
+    """Manifest loader creating a mocked manifest."""
+
+    def load(self, filepath):
+        """Load the manifest."""
+        return MockJinjaManifest()
+
+
+@pytest.fixture(scope="module")
+def app_config(app_config):
+    """Override pytest-invenio app_config fixture."""
+    app_config["WEBPACKEXT_MANIFEST_LOADER"] = MockManifestLoader
+    app_config["SITE_API_URL"] = "https://127.0.0.1:5000/api"
+    app_config["MOCK_SORT_OPTIONS"] = {
+        "newest": dict(title="Newest", fields=["-created"]),
+        "oldest": dict(title="Oldest", fields=["created"]),
+    }
+    app_config["MOCK_SEARCH"] = {
+        "sort": ["newest", "oldest"],
+    }
+    return app_config
+
+
 @pytest.fixture(scope="module")
 def extra_entry_points():
     """Register extra entry point."""
@@ -67,8 +109,22 @@ def admin_role_need(db):
     return action_role.need
 
 
+@pytest.fixture
+def administration_role_need(db):
+    """Store 1 role with 'administration-access' ActionNeed."""
+    role = Role(name="administration-access")
+    db.session.add(role)
+
+    action_role = ActionRoles.create(action=administration_access_action, role=role)
+    db.session.add(action_role)
+
+    db.session.commit()
+
+    return action_role.need
+
+
 @pytest.fixture()
-def admin(UserFixture, app, db, admin_role_need):
+def admin(UserFixture, app, db, admin_role_need, administration_role_need):
     """Admin user for requests."""
     u = UserFixture(
         email="admin@inveniosoftware.org",
@@ -77,13 +133,24 @@ def admin(UserFixture, app, db, admin_role_need):
     u.create(app, db)
 
     datastore = app.extensions["security"].datastore
-    _, role = datastore._prepare_role_modify_args(u.user, "admin-access")
-
-    datastore.add_role_to_user(u.user, role)
+    for role_name in ("admin-access", "administration-access"):
+        _, role = datastore._prepare_role_modify_args(u.user, role_name)
+        datastore.add_role_to_user(u.user, role)
     db.session.commit()
     return u
 
 
+@pytest.fixture()
+def user(UserFixture, app, db):
+    """User without administration access."""
+    u = UserFixture(
+        email="user@inveniosoftware.org",
+        password="user",
+    )
+    u.create(app, db)
+    return u
+
+
 @pytest.fixture
 def superuser_identity(admin, superuser_role_need):
     """Superuser identity fixture."""
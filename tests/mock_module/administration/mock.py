@@ -23,6 +23,9 @@ class MockView(AdminResourceListView):
     category = "Test category"
     url = "mocked_details_url"
     resource_config = "mocks"
+    api_endpoint = "/mocks"
+    search_sort_config_name = "MOCK_SORT_OPTIONS"
+    item_field_list = {"title": {"text": "Title", "order": 1}}
 
 
 class MockViewAlternate(AdminResourceListView):
@@ -34,4 +37,7 @@ class MockViewAlternate(AdminResourceListView):
     name = "mock alternate"
     category = "Test category"
     resource_config = "mocks"
+    api_endpoint = "/mocks"
+    search_sort_config_name = "MOCK_SORT_OPTIONS"
+    search_config_name = "MOCK_SEARCH"
     # url is None to force the name to be used as url
@@ -10,6 +10,8 @@
 
 from invenio_records_resources.services import RecordServiceConfig
 
+from .schema import MockSchema
+
 
 class ServiceConfig(RecordServiceConfig):
     """Mock service configuration.
@@ -19,4 +21,4 @@ class ServiceConfig(RecordServiceConfig):
 
     permission_policy_cls = None
     record_cls = None
-    schema = None
+    schema = MockSchema
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Mock schema for testing."""
+
+from marshmallow import Schema, fields
+
+
+class MockSchema(Schema):
+    """Mock record schema."""
+
+    id = fields.String(dump_only=True)
+    title = fields.String(required=True, metadata={"title": "Title"})
+    description = fields.String()
@@ -8,7 +8,14 @@
 
 """Invenio Administration menu test module."""
 
-from mock_module.administration.mock import MockView
+from flask import Flask, g, request
+from flask_principal import AnonymousIdentity
+from invenio_access import action_factory
+from mock_module.administration.mock import MockView, MockViewAlternate
+
+from invenio_administration.generators import Administration
+from invenio_administration.menu.menu import AdminMenu, MenuItem
+from invenio_administration.permissions import compile_permission
 
 
 def test_menu_generation(current_admin_menu, current_admin_core, test_app):
@@ -44,3 +51,86 @@ def test_menu_generation(current_admin_menu, current_admin_core, test_app):
     test_context = test_app.test_request_context()
     with app_context, test_context:
         assert menu_entry.url == f"{current_admin_core.url}/{mock_view.url}"
+
+
+def test_menu_active_matcher():
+    """Test the active menu items are resolved from the compiled rules."""
+    app = Flask("testapp")
+    for rule, endpoint in [
+        ("/admin/", "dashboard"),
+        ("/admin/books", "books"),
+        ("/admin/books/<pid_value>", "book"),
+        ("/admin/bookshelves", "bookshelves"),
+    ]:
+        app.add_url_rule(rule, endpoint, lambda **kwargs: "")
+
+    menu = AdminMenu()
+    menu.add_menu_item(MenuItem(name="dashboard", endpoint="dashboard"))
+    menu.add_menu_item(MenuItem(name="books", endpoint="books", category="Library"))
+    menu.add_menu_item(
+        MenuItem(name="bookshelves", endpoint="bookshelves", category="Library")
+    )
+    menu.compile_active_matcher(app.url_map)
+
+    for path, active in [
+        ("/admin/", {"dashboard"}),
+        ("/admin/books", {"books"}),
+        ("/admin/books/1", {"books"}),
+        ("/admin/bookshelves", {"bookshelves"}),
+        ("/admin/unknown", set()),
+    ]:
+        with app.test_request_context(path):
+            assert menu.get_active_endpoints() == active
+
+
+def test_sidebar_cache(create_app, app_config, superuser_identity, monkeypatch):
+    """Test the rendered sidebar is cached per active item and permissions."""
+    # restrict a view to superusers
+    monkeypatch.setattr(
+        MockViewAlternate,
+        "_compiled_permission",
+        compile_permission([Administration(action_factory("administration-mock"))]),
+        raising=False,
+    )
+    # a new app, with its menu not registered yet
+    test_app = create_app(**app_config)
+    admin = test_app.extensions["invenio-administration"].administration
+    mock_url = f"{admin.url}{admin.get_view_instance(MockView.name).url}"
+
+    with test_app.test_request_context(mock_url):
+        admin.register_menu()
+        g.identity = superuser_identity
+        sidebar = admin.render_sidebar()
+        assert f'href="{mock_url}"' in sidebar
+        assert admin.render_sidebar() is sidebar
+
+    with test_app.test_request_context(f"{admin.url}/"):
+        g.identity = superuser_identity
+        assert admin.render_sidebar() is not sidebar
+        g.identity = AnonymousIdentity()
+        sidebar = admin.render_sidebar()
+        assert MockViewAlternate.name not in sidebar
+        assert MockView.name in sidebar
+    assert len(admin._sidebar_fragments) == 3
+
+    admin.invalidate_sidebar()
+    assert len(admin._sidebar_fragments) == 0
+
+
+def test_sidebar_cache_custom_active(create_app, app_config, superuser_identity):
+    """Test the sidebar is cached per item active by a custom condition."""
+    test_app = create_app(**app_config)
+    admin = test_app.extensions["invenio-administration"].administration
+    (menu_item,) = [item for item in admin._menu.items if item.name == MockView.name]
+    menu_item.active_when = lambda: request.args.get("tab") == "mock"
+
+    with test_app.test_request_context(f"{admin.url}/"):
+        admin.register_menu()
+        g.identity = superuser_identity
+        assert admin._menu.get_custom_active_names() == frozenset()
+        sidebar = admin.render_sidebar()
+
+    with test_app.test_request_context(f"{admin.url}/?tab=mock"):
+        g.identity = superuser_identity
+        assert admin._menu.get_custom_active_names() == {MockView.name}
+        assert admin.render_sidebar() is not sidebar
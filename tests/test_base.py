@@ -1,7 +1,20 @@
+import threading
+import time
+
 import pytest
+from flask import g
+from flask_principal import AnonymousIdentity
+from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_records_resources.services.errors import PermissionDeniedError
 from mock_module.administration.mock import MockView, MockViewAlternate
+from werkzeug.exceptions import Forbidden
 
-from invenio_administration.views.base import AdminView
+from invenio_administration.permissions import administration_access_action
+from invenio_administration.views.base import (
+    AdminResourceDetailView,
+    AdminResourceListView,
+    AdminView,
+)
 
 
 class TestCustomView(AdminView):
@@ -91,3 +104,166 @@ def test_view_registration_url_explicit(test_app, current_admin_core):
         if x.rule == f"{current_admin_core.url}/{MockView.url}"
     ]
     assert len(custom_view_rule) == 1
+
+
+def test_resource_resolved_once(test_app, mock_extension, mock_extension_name):
+    """Test concurrent first accesses resolve the resource a single time."""
+    calls = []
+
+    class LazyView(AdminResourceListView):
+        name = "lazy"
+        resource_config = "mocks"
+
+        @classmethod
+        def _get_resource(cls, extension_name=None):
+            calls.append(extension_name)
+            time.sleep(0.05)
+            return super()._get_resource(extension_name)
+
+    view = LazyView(extension_name=mock_extension_name, admin=None, url="/lazy")
+    resources = []
+
+    def resolve():
+        with test_app.app_context():
+            resources.append(view.resource)
+
+    threads = [threading.Thread(target=resolve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [mock_extension_name]
+    assert resources == [mock_extension.mocks] * 4
+    # stored on the class, read without resolving
+    assert LazyView.__dict__["resource"] is mock_extension.mocks
+    assert LazyView.resource is mock_extension.mocks
+
+
+def test_shared_view(test_app, current_admin_core, superuser_identity):
+    """Test shared views dispatch every request to the same instance."""
+    instances = []
+
+    class SharedView(AdminView):
+        name = "shared"
+
+        def __init__(self, *args, **kwargs):
+            instances.append(self)
+            super().__init__(*args, **kwargs)
+
+        def get(self):
+            return str(id(self))
+
+    view_instance = SharedView(admin=current_admin_core, extension_name="shared")
+    view = view_instance.as_shared_view()
+    assert view.view_class is SharedView
+    assert view.__name__ == SharedView.name
+
+    with test_app.test_request_context():
+        g.identity = AnonymousIdentity()
+        with pytest.raises(Forbidden):
+            view()
+
+        g.identity = superuser_identity
+        g.identity.provides.add(administration_access_action)
+        assert view() == view() == str(id(view_instance))
+    assert instances == [view_instance]
+
+    with pytest.raises(AttributeError):
+        view_instance.url = "/other"
+
+
+def test_prefetch_search(
+    test_app, current_admin_core, mock_resource, superuser_identity, monkeypatch
+):
+    """Test list views embed the results of their initial query."""
+    searches = []
+
+    class Results:
+        def to_dict(self):
+            return {"hits": {"hits": [], "total": 0}, "aggregations": {}}
+
+    def search(identity, params=None):
+        searches.append(params)
+        return Results()
+
+    monkeypatch.setattr(mock_resource.service, "search", search)
+    view_instance = current_admin_core.get_view_instance(MockView.name)
+
+    with test_app.test_request_context():
+        g.identity = superuser_identity
+        assert "data-prefetched-search" not in view_instance.get()
+        assert searches == []
+
+        monkeypatch.setitem(test_app.config, "ADMINISTRATION_PREFETCH_SEARCH", True)
+        assert "data-prefetched-search" in view_instance.get()
+        search_config = view_instance.get_static_context()["search_config"]()
+        assert searches == [
+            {
+                "q": "",
+                "sort": search_config["defaultSortingOnEmptyQueryString"]["sortBy"],
+                "page": 1,
+                "size": search_config["initialQueryState"]["size"],
+            }
+        ]
+
+    # other queries are run by the search app
+    with test_app.test_request_context("/?q=title"):
+        g.identity = superuser_identity
+        assert view_instance.prefetch_search_results() is None
+    assert len(searches) == 1
+
+
+def test_prefetch_record(
+    test_app,
+    current_admin_core,
+    mock_resource,
+    mock_extension_name,
+    superuser_identity,
+    monkeypatch,
+    caplog,
+):
+    """Test detail views inline the record and its ETag."""
+    reads = []
+
+    class Item:
+        def to_dict(self):
+            return {"id": "1", "title": "Title", "revision_id": 3}
+
+    def read(identity, id_):
+        reads.append(id_)
+        if id_ == "2":
+            raise PIDDoesNotExistError("recid", id_)
+        if id_ == "3":
+            raise PermissionDeniedError()
+        if id_ != "1":
+            raise KeyError(id_)
+        return Item()
+
+    monkeypatch.setattr(mock_resource.service, "read", read)
+
+    class DetailView(AdminResourceDetailView):
+        name = "mock details"
+        resource_config = "mocks"
+
+    view_instance = DetailView(
+        extension_name=mock_extension_name, admin=current_admin_core, url="/details"
+    )
+
+    with test_app.test_request_context():
+        g.identity = superuser_identity
+        assert view_instance.get_record_context("1") == {}
+
+        monkeypatch.setitem(test_app.config, "ADMINISTRATION_PREFETCH_RECORD", True)
+        context = view_instance.get_record_context("1")
+        assert context["record"] == Item().to_dict()
+        assert context["record_etag"] == '"3"'
+        assert reads == ["1"]
+
+        # the page requests records failing to be read
+        assert view_instance.get_record_context("2") == {}
+        assert view_instance.get_record_context("3") == {}
+        assert "ERROR" not in caplog.text
+        # only unexpected failures are logged
+        assert view_instance.get_record_context("4") == {}
+        assert "Failed to prefetch mock details record 4" in caplog.text
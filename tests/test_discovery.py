@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration entry point discovery test module."""
+
+import os
+
+import importlib_metadata
+
+from invenio_administration import InvenioAdministration, discovery
+from invenio_administration.discovery import DiscoveryCache, discover_entry_points
+from invenio_administration.lazy import LazyView, dump_view_metadata
+from invenio_administration.views.base import AdminView
+
+GROUP = "invenio_administration.views"
+
+
+def test_discover_entry_points_cache(tmp_path, monkeypatch):
+    """Test the discovered entry points are cached per environment."""
+    cache_path = str(tmp_path / "entry_points.json")
+    scanned = discover_entry_points([GROUP], DiscoveryCache(cache_path))
+    expected = {(ep.name, ep.value) for ep in scanned.select(group=GROUP)}
+    assert expected
+
+    def scan():
+        raise AssertionError("installed distributions scanned")
+
+    monkeypatch.setattr(importlib_metadata, "entry_points", scan)
+    cached = discover_entry_points([GROUP], DiscoveryCache(cache_path))
+    assert {(ep.name, ep.value) for ep in cached.select(group=GROUP)} == expected
+    assert all(ep.load() for ep in cached.select(group=GROUP))
+
+    # a changed environment is scanned again
+    monkeypatch.undo()
+    monkeypatch.setattr(discovery, "environment_fingerprint", lambda: "changed")
+    rescanned = discover_entry_points([GROUP], DiscoveryCache(cache_path))
+    assert {(ep.name, ep.value) for ep in rescanned.select(group=GROUP)} == expected
+    with open(cache_path) as fp:
+        assert '"changed"' in fp.read()
+    # written through files of their own, replacing the cache
+    assert os.listdir(tmp_path) == ["entry_points.json"]
+
+
+def test_lazy_views(create_app, app_config, tmp_path, monkeypatch):
+    """Test views are registered from the cached metadata, loaded on use."""
+    loaded = []
+    load_entry_point = InvenioAdministration._load_entry_point
+
+    def _load_entry_point(self, entry_point):
+        loaded.append(entry_point.value)
+        return load_entry_point(self, entry_point)
+
+    monkeypatch.setattr(InvenioAdministration, "_load_entry_point", _load_entry_point)
+    config = dict(
+        app_config,
+        ADMINISTRATION_ENTRY_POINTS_CACHE=str(tmp_path / "entry_points.json"),
+        ADMINISTRATION_LAZY_VIEWS=True,
+    )
+
+    # the first app imports the views to cache their metadata
+    create_app(**config)
+    assert loaded
+
+    loaded.clear()
+    app = create_app(**config)
+    assert not loaded
+    assert "administration.mock" in app.url_map._rules_by_endpoint
+    (rule,) = app.url_map._rules_by_endpoint["administration.mock"]
+    assert rule.methods == {"GET", "HEAD", "OPTIONS"}
+    admin = app.extensions["invenio-administration"].administration
+    lazy_view_function = app.view_functions["administration.mock"]
+
+    view_instance = admin.get_view_instance("mock")
+    assert loaded == [view_instance.__module__ + ":" + type(view_instance).__name__]
+    assert view_instance.name == "mock"
+    assert app.view_functions["administration.mock"] is not lazy_view_function
+    assert admin.get_view_instance("mock") is view_instance
+    assert len(loaded) == 1
+
+
+def test_lazy_view_methods(test_app, current_admin_core):
+    """Test lazy views are registered with the methods of their class."""
+
+    class FormView(AdminView):
+        name = "form"
+
+        def get(self):
+            return ""
+
+        def post(self):
+            return ""
+
+    view_instance = FormView(admin=current_admin_core, extension_name="form")
+    metadata = dump_view_metadata(view_instance, in_menu=False)
+    assert metadata["methods"] == ["GET", "POST"]
+    assert LazyView(metadata, current_admin_core).methods == ["GET", "POST"]
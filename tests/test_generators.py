@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration permission generators test module."""
+
+from flask_principal import AnonymousIdentity
+from invenio_records.systemfields import SystemFieldsMixin
+from invenio_records_permissions.policies import BasePermissionPolicy
+from invenio_records_resources.records import Record
+from invenio_records_resources.records.systemfields import IndexField
+from invenio_records_resources.services import RecordService
+from mock_module.config import ServiceConfig
+
+from invenio_administration.generators import Administration
+
+
+class MockRecord(Record, SystemFieldsMixin):
+    """Mock record."""
+
+    index = IndexField("mocks-mock-v1.0.0", search_alias="mocks")
+
+
+class MockPermissionPolicy(BasePermissionPolicy):
+    """Mock permission policy restricting searches to administrators."""
+
+    can_search = [Administration()]
+
+
+class MockServiceConfig(ServiceConfig):
+    """Mock service configuration with an administration search policy."""
+
+    permission_policy_cls = MockPermissionPolicy
+    record_cls = MockRecord
+
+
+def _search_filter(service, identity):
+    """Get the permission filter of a search request."""
+    search = service.create_search(
+        identity,
+        MockRecord,
+        service.config.search,
+        permission_action="search",
+    )
+    return search.to_dict()["query"]["bool"]["filter"]
+
+
+def test_query_filter(test_app, admin):
+    """Test searches are restricted by the search engine."""
+    service = RecordService(MockServiceConfig)
+
+    with test_app.test_request_context():
+        assert _search_filter(service, admin.identity) == [{"match_all": {}}]
+        assert _search_filter(service, AnonymousIdentity()) == [{"match_none": {}}]
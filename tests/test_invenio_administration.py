@@ -8,9 +8,15 @@
 
 """Module tests."""
 
+import gc
+import logging
+
 from flask import Flask
+from mock_module.administration.mock import MockView, MockViewAlternate
 
 from invenio_administration import InvenioAdministration
+from invenio_administration.cli import preload, profile, warmup
+from invenio_administration.profiling import STAGES
 
 
 def test_version():
@@ -31,3 +37,62 @@ def test_init():
     assert "invenio-administration" not in app.extensions
     ext.init_app(app)
     assert "invenio-administration" in app.extensions
+
+
+def test_warmup(test_app, current_admin_ext, current_admin_core):
+    """Test the views are prepared ahead of the first request."""
+    result = test_app.test_cli_runner().invoke(warmup)
+    assert result.exit_code == 0, result.output
+    assert f"{MockView.name}: " in result.output
+    assert f"{MockViewAlternate.name}: " in result.output
+    assert current_admin_ext.warmed_up
+    assert MockView.resource is not None
+    assert (MockView.name, "en") in current_admin_core._schema_documents
+
+
+def test_preload(test_app):
+    """Test the preload memory report."""
+    try:
+        result = test_app.test_cli_runner().invoke(preload)
+    finally:
+        gc.unfreeze()
+    assert result.exit_code == 0, result.output
+    assert "Views: 2" in result.output
+    assert "RSS saved per worker" in result.output
+
+
+def test_startup_profile(create_app, app_config, caplog):
+    """Test the startup profile of the views."""
+    caplog.set_level(logging.INFO)
+    app = create_app(
+        **app_config,
+        ADMINISTRATION_STARTUP_PROFILE=True,
+        ADMINISTRATION_STARTUP_PROFILE_LOG=True,
+    )
+    report = app.extensions["invenio-administration"].startup_profiler.report()
+    assert {view.name for view in report} == {MockView.name, MockViewAlternate.name}
+    assert all(set(view.timings) == set(STAGES) for view in report)
+    assert report[0].total_time >= report[1].total_time
+
+    records = [r for r in caplog.records if hasattr(r, "administration_view")]
+    assert [r.administration_view for r in records] == [v.name for v in report]
+
+    with app.app_context():
+        result = app.test_cli_runner().invoke(profile)
+    assert result.exit_code == 0, result.output
+    assert f"{MockView.name}: " in result.output
+
+
+def test_startup_profile_disabled(test_app):
+    """Test the profile command without a startup profile."""
+    result = test_app.test_cli_runner().invoke(profile)
+    assert result.exit_code != 0
+    assert "ADMINISTRATION_STARTUP_PROFILE" in result.output
+
+
+def test_shared_views_config(create_app, app_config):
+    """Test the registered views are shared by requests."""
+    app = create_app(**app_config, ADMINISTRATION_SHARED_VIEWS=True)
+    admin = app.extensions["invenio-administration"].administration
+    for view_instance in admin.registry:
+        assert view_instance._frozen
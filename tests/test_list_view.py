@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration list view test module."""
+
+import pytest
+from flask import g
+from flask_principal import AnonymousIdentity
+from mock_module.administration.mock import MockView
+from werkzeug.exceptions import Forbidden, NotFound
+
+from invenio_administration.permissions import administration_access_action
+
+
+def test_schema_endpoint(client_with_login, current_admin_core):
+    """Test the schema endpoint is cacheable by content hash."""
+    url = f"{current_admin_core.url}/_schemas/{MockView.name}"
+
+    response = client_with_login.get(url)
+    assert response.status_code == 200
+    assert response.json["resource_schema"]["title"]["type"] == "string"
+    assert response.headers["ETag"]
+    assert response.cache_control.private
+    assert response.cache_control.max_age == 31536000
+
+    response = client_with_login.get(
+        url, headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+
+def test_schema_projection(test_app, current_admin_core, monkeypatch):
+    """Test the resource schema is projected on the fields the view displays."""
+    assert MockView.get_schema_projection() == {"title", "pid"}
+    # computed once per view class
+    assert MockView.get_schema_projection() is MockView.get_schema_projection()
+
+    class SubView(MockView):
+        item_field_list = {"description": {"text": "Description", "order": 1}}
+
+    assert SubView.get_schema_projection() == {"description", "pid"}
+    assert MockView.get_schema_projection() == {"title", "pid"}
+
+    view = current_admin_core.get_view_instance(MockView.name)
+    with test_app.test_request_context():
+        resource_schema = view.get_schema_payload()["resource_schema"]
+        assert set(resource_schema) == {"title"}
+
+        monkeypatch.setitem(test_app.config, "ADMINISTRATION_SCHEMA_PROJECTION", False)
+        resource_schema = view.get_schema_payload()["resource_schema"]
+        assert set(resource_schema) == {"id", "title", "description"}
+
+
+def test_schema_endpoint_errors(test_app, current_admin_core, superuser_identity):
+    """Test the schema endpoint of unknown and non-resource views.
+
+    The view function is called directly, the theme's error pages are not
+    under test.
+    """
+    schema_view = test_app.view_functions[f"{current_admin_core.endpoint}._schema"]
+    dashboard = current_admin_core.dashboard_view_class.name
+
+    with test_app.test_request_context():
+        g.identity = AnonymousIdentity()
+        with pytest.raises(Forbidden):
+            schema_view(view_name=MockView.name)
+
+        g.identity = superuser_identity
+        g.identity.provides.add(administration_access_action)
+        with pytest.raises(NotFound):
+            schema_view(view_name="unknown")
+        with pytest.raises(NotFound):
+            schema_view(view_name=dashboard)
+        assert schema_view(view_name=MockView.name).status_code == 200
+
+
+@pytest.fixture
+def ignore_url_build_errors(test_app):
+    """Ignore links to endpoints of other modules in the page templates."""
+
+    def handler(error, endpoint, values):
+        return "#"
+
+    test_app.url_build_error_handlers.append(handler)
+    yield
+    test_app.url_build_error_handlers.remove(handler)
+
+
+@pytest.mark.usefixtures("ignore_url_build_errors")
+def test_list_view_schema_url(
+    client_with_login, current_admin_core, test_app, monkeypatch, request
+):
+    """Test the list view references or inlines the schemas."""
+    url = f"{current_admin_core.url}/{MockView.url}"
+
+    response = client_with_login.get(url)
+    assert response.status_code == 200
+    html = response.get_data(as_text=True)
+    schema_url = f"{current_admin_core.url}/_schemas/{MockView.name}?v="
+    assert f"data-schema-url='{schema_url}" in html
+    assert "data-resource-schema" not in html
+
+    monkeypatch.setitem(test_app.config, "ADMINISTRATION_INLINE_SCHEMAS", True)
+    current_admin_core.invalidate_schema_documents()
+    # the contexts inlining the schemas are not reused by other tests
+    request.addfinalizer(current_admin_core.invalidate_schema_documents)
+    response = client_with_login.get(url)
+    html = response.get_data(as_text=True)
+    assert "data-resource-schema=" in html
+    assert "data-schema-url" not in html
+
+
+def test_static_context(test_app, current_admin_core):
+    """Test the view context is built once and frozen."""
+    view = current_admin_core.get_view_instance(MockView.name)
+    with test_app.test_request_context():
+        context = view.get_static_context()
+        assert view.get_static_context() is context
+        assert context["name"] == MockView.name
+        assert context["search_config"]()["searchApi"]["axios"]["url"].endswith(
+            "/mocks"
+        )
+        with pytest.raises(TypeError):
+            context["title"] = "changed"
+
+        current_admin_core.invalidate_schema_documents()
+        assert view.get_static_context() is not context
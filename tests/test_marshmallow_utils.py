@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration marshmallow utils test module."""
+
+import pytest
+from marshmallow import Schema, fields
+
+from invenio_administration.errors import (
+    RecursiveSchema,
+    SchemaMaxDepthExceeded,
+    UnrecognisedSchemaField,
+)
+from invenio_administration.marshmallow_utils import (
+    FieldTypeRegistry,
+    SchemaJSONCache,
+    create_field_types,
+    jsonify_schema,
+)
+
+
+class AuthorSchema(Schema):
+    """Nested test schema."""
+
+    name = fields.String(required=True)
+    age = fields.Integer()
+
+
+class BookSchema(Schema):
+    """Test schema."""
+
+    title = fields.String(required=True, metadata={"title": "Title"})
+    tags = fields.List(fields.String())
+    author = fields.Nested(AuthorSchema)
+
+
+def test_jsonify_schema():
+    """Test the serialization of a schema with nested fields."""
+    serialized = jsonify_schema(BookSchema())
+
+    assert serialized["title"]["type"] == "string"
+    assert serialized["title"]["required"] is True
+    assert serialized["title"]["title"] == "Title"
+    assert serialized["tags"]["items"] == {"type": "string"}
+    assert serialized["author"]["type"] == "object"
+    assert serialized["author"]["properties"]["age"]["type"] == "integer"
+
+
+def test_schema_cache():
+    """Test the serialized schemas are cached per schema class."""
+    cache = SchemaJSONCache(maxsize=2)
+
+    serialized = cache.get(BookSchema)
+    assert cache.get(BookSchema()) is serialized
+    assert cache.get(BookSchema(only=["title"])) is not serialized
+    assert len(cache) == 2
+
+    # least recently used entries are evicted
+    cache.get(AuthorSchema)
+    assert len(cache) == 2
+    assert cache.get(BookSchema) is not serialized
+
+    cache.invalidate(BookSchema)
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+class NodeSchema(Schema):
+    """Recursive test schema."""
+
+    name = fields.String()
+    children = fields.List(fields.Nested(lambda: NodeSchema()))
+
+
+class LibrarySchema(Schema):
+    """Test schema reusing the same nested schema."""
+
+    author = fields.Nested(AuthorSchema)
+    editors = fields.List(fields.Nested(AuthorSchema))
+
+
+def test_jsonify_schema_refs():
+    """Test the serialization of nested schemas with references."""
+    serialized = jsonify_schema(LibrarySchema(), refs=True)
+
+    assert serialized["$ref"] == "#/$defs/LibrarySchema"
+    library = serialized["$defs"]["LibrarySchema"]
+    assert library["author"]["$ref"] == "#/$defs/AuthorSchema"
+    assert library["editors"]["items"]["$ref"] == "#/$defs/AuthorSchema"
+    assert serialized["$defs"]["AuthorSchema"]["name"]["type"] == "string"
+
+
+def test_jsonify_schema_recursive():
+    """Test recursive schemas are detected."""
+    with pytest.raises(RecursiveSchema):
+        jsonify_schema(NodeSchema())
+
+    serialized = jsonify_schema(NodeSchema(), refs=True)
+    node = serialized["$defs"]["NodeSchema"]
+    assert node["children"]["items"]["$ref"] == "#/$defs/NodeSchema"
+
+    with pytest.raises(SchemaMaxDepthExceeded):
+        jsonify_schema(LibrarySchema(), max_depth=0)
+    with pytest.raises(SchemaMaxDepthExceeded):
+        jsonify_schema(LibrarySchema(), refs=True, max_depth=0)
+    # references to existing definitions do not nest deeper
+    serialized = jsonify_schema(NodeSchema(), refs=True, max_depth=0)
+    assert "NodeSchema" in serialized["$defs"]
+
+
+class CustomString(fields.String):
+    """Subclassed field."""
+
+
+def test_field_types_registry():
+    """Test field classes resolve through their MRO."""
+    registry = FieldTypeRegistry({fields.String: "string"})
+
+    serializer = registry.resolve(CustomString)
+    assert serializer(None, CustomString(), 0) == {"type": "string"}
+    assert registry.resolve(CustomString) is serializer
+
+    registry.register(CustomString, "custom")
+    assert registry.resolve(CustomString)(None, CustomString(), 0) == {
+        "type": "custom"
+    }
+
+    with pytest.raises(UnrecognisedSchemaField):
+        registry.resolve(fields.Integer)
+
+
+class UnknownField(fields.Field):
+    """Unregistered field type."""
+
+
+class UnknownFieldSchema(Schema):
+    """Test schema with an unregistered field type."""
+
+    unknown = UnknownField()
+
+
+def test_field_types_per_registry():
+    """Test schemas are serialized with the given field types."""
+    with pytest.raises(UnrecognisedSchemaField) as excinfo:
+        jsonify_schema(UnknownFieldSchema())
+    assert "unknown" in str(excinfo.value)
+
+    registry = create_field_types()
+    registry.register(UnknownField, "custom")
+    cache = SchemaJSONCache(field_types=registry)
+    assert cache.get(UnknownFieldSchema)["unknown"]["type"] == "custom"
+    # the default field types are left untouched
+    with pytest.raises(UnrecognisedSchemaField):
+        jsonify_schema(UnknownFieldSchema())
+
+
+def test_jsonify_schema_projection():
+    """Test the serialization of selected fields only."""
+    serialized = jsonify_schema(BookSchema(), projection={"title", "author.name"})
+
+    assert set(serialized) == {"title", "author"}
+    assert set(serialized["author"]["properties"]) == {"name"}
+
+    serialized = jsonify_schema(BookSchema(), projection={"author"})
+    assert set(serialized["author"]["properties"]) == {"name", "age"}
+
+
+def test_schema_cache_instance_options():
+    """Test schema instance options changing the output are part of the key."""
+    cache = SchemaJSONCache()
+
+    serialized = cache.get(AuthorSchema)
+    assert serialized["name"]["readOnly"] is False
+
+    dump_only = cache.get(AuthorSchema(dump_only=("name",)))
+    assert dump_only is not serialized
+    assert dump_only["name"]["readOnly"] is True
+
+    assert cache.get(AuthorSchema(context={"a": 1})) is not serialized
+    assert cache.get(AuthorSchema(context={"a": 1})) is cache.get(
+        AuthorSchema(context={"a": 1})
+    )
+    # unhashable options bypass the cache
+    unhashable = AuthorSchema(context={"a": object})
+    unhashable.context["b"] = [{}]
+    assert cache.get(unhashable)["name"]["readOnly"] is False
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration list view searches test module."""
+
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from flask import g, json
+from invenio_records.models import RecordMetadata
+from invenio_records.systemfields import SystemFieldsMixin
+from invenio_records_permissions.generators import AnyUser
+from invenio_records_permissions.policies import BasePermissionPolicy
+from invenio_records_resources.records import Record
+from invenio_records_resources.records.systemfields import IndexField
+from invenio_records_resources.resources import RecordResource
+from invenio_records_resources.services import RecordService
+from invenio_records_resources.services.base.links import Link
+from invenio_search.api import RecordsSearchV2
+from invenio_search.engine import search
+from mock_module.administration.mock import MockView
+from mock_module.config import ServiceConfig
+from mock_module.resource import MockResource
+from opensearch_dsl.response import Hit
+from werkzeug.exceptions import BadRequest, NotFound
+
+from invenio_administration.errors import InvalidCursor
+from invenio_administration.pagination import decode_cursor, encode_cursor
+from invenio_administration.views.base import AdminResourceListView
+
+HITS = [
+    {
+        "uuid": str(UUID(int=i)),
+        "version_id": 1,
+        "created": f"2022-01-0{i}",
+        "updated": f"2022-01-0{i}",
+        "title": f"Title {i}",
+        "description": f"Description {i}",
+    }
+    for i in range(1, 6)
+]
+IDS = [hit["uuid"] for hit in HITS]
+
+
+class MockRecord(Record, SystemFieldsMixin):
+    """Mock record."""
+
+    model_cls = RecordMetadata
+    index = IndexField("mocks-mock-v1.0.0", search_alias="mocks")
+
+
+class MockPermissionPolicy(BasePermissionPolicy):
+    """Mock permission policy allowing searches."""
+
+    can_search = [AnyUser()]
+
+
+class MockServiceConfig(ServiceConfig):
+    """Mock service configuration."""
+
+    permission_policy_cls = MockPermissionPolicy
+    record_cls = MockRecord
+    links_item = {
+        "self": Link(
+            "{+api}/mocks/{id}",
+            vars=lambda record, vars: vars.update({"id": record.id}),
+        )
+    }
+
+
+@pytest.fixture()
+def searches(monkeypatch):
+    """Search requests, answered from ``HITS`` sorted by creation date."""
+    requests = []
+
+    def execute(self, ignore_cache=False):
+        body = self.to_dict()
+        requests.append(body)
+        after = body.get("search_after", ["", ""])[0]
+        hits = [hit for hit in HITS if hit["created"] > after][: body["size"]]
+        includes = body.get("_source", {}).get("includes")
+        raw = {
+            "hits": {
+                "total": {"value": len(HITS), "relation": "eq"},
+                "hits": [
+                    {
+                        "_source": {
+                            key: value
+                            for key, value in hit.items()
+                            if includes is None or key in includes
+                        },
+                        "sort": [hit["created"], hit["uuid"]],
+                    }
+                    for hit in hits
+                ],
+            }
+        }
+        return self._response_class(self, raw)
+
+    monkeypatch.setattr(RecordsSearchV2, "execute", execute)
+    return requests
+
+
+@pytest.fixture()
+def cursor_view(current_admin_core, mock_extension_name):
+    """List view paging with cursors."""
+
+    class CursorView(AdminResourceListView):
+        name = "cursors"
+        resource_config = "mocks"
+        resource = RecordResource(MockResource, RecordService(MockServiceConfig))
+        cursor_pagination = True
+
+    return CursorView(
+        extension_name=mock_extension_name, admin=current_admin_core, url="/cursors"
+    )
+
+
+def test_cursor():
+    """Test cursors encode sort values."""
+    cursor = encode_cursor(["2022-01-01", "1"])
+    assert decode_cursor(cursor) == ["2022-01-01", "1"]
+
+    for invalid in ["not a cursor", encode_cursor([])[:-2], "eyJhIjogMX0="]:
+        with pytest.raises(InvalidCursor):
+            decode_cursor(invalid)
+
+
+def test_search_after(test_app, cursor_view, searches, superuser_identity):
+    """Test pages are searched after the cursor of the previous page."""
+    params = {"q": "", "sort": "newest", "size": 2}
+    pages = []
+    with test_app.test_request_context():
+        g.identity = superuser_identity
+        cursor = None
+        for _ in range(3):
+            results = cursor_view.search_after(params, cursor)
+            pages.append([hit["id"] for hit in results["hits"]["hits"]])
+            cursor = results.get("cursor")
+
+    assert pages == [IDS[:2], IDS[2:4], IDS[4:]]
+    assert cursor is None
+    # from the first hit, with a stable sort
+    assert {search["from"] for search in searches} == {0}
+    assert searches[0]["sort"] == [{"created": {"order": "desc"}}, "uuid"]
+    assert searches[0]["track_total_hits"] is True
+    assert "search_after" not in searches[0]
+    assert searches[1]["search_after"] == ["2022-01-02", IDS[1]]
+
+
+def test_search_view(
+    test_app,
+    current_admin_core,
+    cursor_view,
+    searches,
+    superuser_identity,
+    monkeypatch,
+):
+    """Test the search endpoint of views paging with cursors."""
+    current_admin_core.registry.add(
+        SimpleNamespace(view_class=type(cursor_view)), cursor_view
+    )
+    cursor = encode_cursor(["2022-01-02", IDS[1]])
+
+    with test_app.test_request_context(f"/?size=2&cursor={cursor}"):
+        g.identity = superuser_identity
+        response = current_admin_core.search_view("cursors")
+        assert [hit["id"] for hit in response.json["hits"]["hits"]] == IDS[2:4]
+
+    with test_app.test_request_context("/?cursor=invalid"):
+        g.identity = superuser_identity
+        with pytest.raises(BadRequest):
+            current_admin_core.search_view("cursors")
+
+        # views paging with offsets use their API
+        with pytest.raises(NotFound):
+            current_admin_core.search_view(MockView.name)
+
+    def execute(self, ignore_cache=False):
+        raise search.exceptions.RequestError(400, "search_phase_execution_exception")
+
+    monkeypatch.setattr(RecordsSearchV2, "execute", execute)
+
+    # invalid queries, rejected by the service or by the search engine
+    for query_string in ["size=100000", "q=title:("]:
+        with test_app.test_request_context(f"/?{query_string}"):
+            g.identity = superuser_identity
+            with pytest.raises(BadRequest):
+                current_admin_core.search_view("cursors")
+
+
+def test_source_filtering(
+    test_app, current_admin_core, mock_extension_name, searches, superuser_identity
+):
+    """Test searches fetch only the fields the view uses."""
+
+    class FilteredView(AdminResourceListView):
+        name = "filtered"
+        resource_config = "mocks"
+        resource = RecordResource(MockResource, RecordService(MockServiceConfig))
+        item_field_list = {"title": {"text": "Title", "order": 1}}
+        actions = {
+            "rename": {
+                "text": "Rename",
+                "order": 1,
+                "payload_schema": None,
+                "source_fields": ["owner"],
+            }
+        }
+        source_filtering = True
+
+    view_instance = FilteredView(
+        extension_name=mock_extension_name, admin=current_admin_core, url="/filtered"
+    )
+    projection = view_instance.get_source_projection()
+    # displayed, used by the actions, and loading the records
+    assert projection == sorted(
+        {"title", "pid", "owner", "id", "uuid", "version_id", "created", "updated"}
+    )
+
+    with test_app.test_request_context():
+        g.identity = superuser_identity
+        results = view_instance.search({"q": "", "size": 2, "page": 2})
+    assert results["hits"]["total"] == len(HITS)
+    assert "cursor" not in results
+    # paged with offsets
+    assert searches[0]["from"] == 2
+    assert searches[0]["_source"] == {"includes": projection}
+    # records loaded from their partial source and serialized by the service
+    hit = results["hits"]["hits"][0]
+    assert hit == {
+        "id": IDS[0],
+        "title": "Title 1",
+        "links": {"self": f"https://127.0.0.1:5000/api/mocks/{IDS[0]}"},
+    }
+
+
+def test_export(
+    test_app,
+    current_admin_core,
+    mock_extension_name,
+    superuser_identity,
+    monkeypatch,
+):
+    """Test the export endpoint streams all the results."""
+    scans = []
+
+    def scan(self):
+        scans.append(self.to_dict())
+        for i, hit in enumerate(HITS, 1):
+            yield Hit({"_source": {**hit, "title": f"={i}"}})
+
+    monkeypatch.setattr(RecordsSearchV2, "scan", scan)
+
+    class ExportView(AdminResourceListView):
+        name = "exports"
+        resource_config = "mocks"
+        resource = RecordResource(MockResource, RecordService(MockServiceConfig))
+        item_field_list = {
+            "title": {"text": "Title", "order": 2},
+            "id": {"text": "Id", "order": 1},
+        }
+
+    view_instance = ExportView(
+        extension_name=mock_extension_name, admin=current_admin_core, url="/exports"
+    )
+    current_admin_core.registry.add(
+        SimpleNamespace(view_class=ExportView), view_instance
+    )
+
+    with test_app.test_request_context("/?q=title&page=3"):
+        g.identity = superuser_identity
+        response = current_admin_core.export_view("exports", "csv")
+        assert response.mimetype == "text/csv"
+        assert "exports.csv" in response.headers["Content-Disposition"]
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[:2] == ["id,title", f"{IDS[0]},'=1"]
+        assert len(lines) == len(HITS) + 1
+
+        response = current_admin_core.export_view("exports", "jsonl")
+        lines = response.get_data(as_text=True).splitlines()
+        assert json.loads(lines[0]) == {"id": IDS[0], "title": "=1"}
+        assert len(lines) == len(HITS)
+
+        with pytest.raises(NotFound):
+            current_admin_core.export_view("exports", "xml")
+
+    def invalid_scan(self):
+        raise search.exceptions.RequestError(400, "search_phase_execution_exception")
+        yield
+
+    monkeypatch.setattr(RecordsSearchV2, "scan", invalid_scan)
+    # raised before streaming the export
+    with test_app.test_request_context("/?q=title:("):
+        g.identity = superuser_identity
+        with pytest.raises(BadRequest):
+            current_admin_core.export_view("exports", "csv")
+
+    # the whole query is scanned in batches
+    assert scans[0]["from"] == 0
+    assert scans[0]["size"] == ExportView.export_batch_size
+    assert scans[0]["query"] != {"match_all": {}}
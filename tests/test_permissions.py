@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration permissions test module."""
+
+import pytest
+from flask import g
+from flask_principal import AnonymousIdentity, Identity, identity_loaded
+from invenio_access import action_factory
+from invenio_access.permissions import Permission
+from mock_module.administration.mock import MockView
+from werkzeug.exceptions import Forbidden
+
+from invenio_administration.generators import Administration
+from invenio_administration.permissions import (
+    administration_access_action,
+    administration_permission,
+    compile_permission,
+)
+
+
+def test_permission_decisions_cached(test_app, superuser_identity, monkeypatch):
+    """Test permissions are decided once per request and identity."""
+    loads = []
+    load_permissions = Permission._load_permissions
+
+    def _load_permissions(self):
+        loads.append(self)
+        return load_permissions(self)
+
+    monkeypatch.setattr(Permission, "_load_permissions", _load_permissions)
+
+    def decide(expected):
+        """Decide twice, returning the number of permission loads."""
+        before = len(loads)
+        assert administration_permission.can() is expected
+        after = len(loads)
+        assert administration_permission.can() is expected
+        assert len(loads) == after
+        return after - before
+
+    with test_app.test_request_context():
+        g.identity = AnonymousIdentity()
+        assert decide(False)
+
+        # a new identity is decided again
+        g.identity = superuser_identity
+        g.identity.provides.add(administration_access_action)
+        assert decide(True)
+
+        # decisions are dropped when the identity is loaded
+        identity_loaded.send(test_app, identity=g.identity)
+        assert decide(True)
+
+    with test_app.test_request_context():
+        g.identity = AnonymousIdentity()
+        assert decide(False)
+
+
+def test_view_permissions(
+    test_app,
+    current_admin_core,
+    administration_role_need,
+    superuser_role_need,
+    monkeypatch,
+):
+    """Test views and actions restricted by their own permissions."""
+    mock_action = action_factory("administration-mock")
+    permission = compile_permission([Administration(mock_action)])
+    # interned by needs
+    assert compile_permission([Administration(mock_action)]) is permission
+    assert MockView.get_permission() is None
+
+    monkeypatch.setattr(MockView, "_compiled_permission", permission, raising=False)
+    # a custom action, served by the schema document shared by all identities
+    monkeypatch.setattr(
+        MockView,
+        "actions",
+        {"block": {"text": "Block", "order": 1, "payload_schema": None}},
+        raising=False,
+    )
+    monkeypatch.setattr(
+        MockView, "action_permission_generators", {"delete": [], "block": []}
+    )
+    monkeypatch.setattr(
+        MockView,
+        "_compiled_action_permissions",
+        {"delete": permission, "block": permission},
+        raising=False,
+    )
+    # allowed the administration access, not the view
+    administrator = Identity(1)
+    administrator.provides.add(administration_role_need)
+    admin = current_admin_core
+    view_instance = admin.get_view_instance(MockView.name)
+    schema_view = test_app.view_functions[f"{admin.endpoint}._schema"]
+    mock_view = test_app.view_functions[f"{admin.endpoint}.{MockView.name}"]
+
+    with test_app.test_request_context():
+        g.identity = administrator
+        assert administration_permission.can()
+        with pytest.raises(Forbidden):
+            schema_view(view_name=MockView.name)
+        with pytest.raises(Forbidden):
+            mock_view()
+        assert MockView.name not in admin._menu.get_visible_names()
+        assert view_instance.get_permissions_context() == {
+            "display_delete": False,
+            "hidden_actions": ["block"],
+        }
+
+    with test_app.test_request_context():
+        superuser = Identity(1)
+        superuser.provides.add(superuser_role_need)
+        g.identity = superuser
+        assert schema_view(view_name=MockView.name).status_code == 200
+        assert MockView.name in admin._menu.get_visible_names()
+        assert view_instance.get_permissions_context() == {}
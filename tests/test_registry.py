@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration view registry test module."""
+
+import pytest
+from flask import render_template_string
+from mock_module.administration.mock import MockView, MockViewAlternate
+
+
+def test_registry_indexes(current_admin_core):
+    """Test the views are indexed by name, endpoint, category and resource."""
+    registry = current_admin_core.registry
+
+    mock = registry.get(MockView.name)
+    assert isinstance(mock, MockView)
+    assert MockView.name in registry
+    assert registry.get("unknown") is None
+    assert registry.get_view_function(MockView.name).view_class is MockView
+    assert registry.get_by_endpoint("administration.mock") is mock
+    assert mock in registry.get_by_category(MockView.category)
+    assert {type(v) for v in registry.get_by_resource_config("mocks")} == {
+        MockView,
+        MockViewAlternate,
+    }
+    assert len(registry) == len(current_admin_core.views) == 3
+
+
+def test_registry_duplicate_name(current_admin_core):
+    """Test view names are unique."""
+    view = current_admin_core.registry.get_view_function(MockView.name)
+    with pytest.raises(ValueError):
+        current_admin_core.add_view(view, current_admin_core.get_view_instance("mock"))
+
+
+def test_registry_template_global(test_app):
+    """Test the registry is available in templates."""
+    with test_app.test_request_context():
+        rendered = render_template_string(
+            "{{ administration_views.get_by_endpoint('administration.mock').name }}"
+        )
+    assert rendered == MockView.name
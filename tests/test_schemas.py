@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2022 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Invenio Administration schema artifacts test module."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from mock_module.administration.mock import MockView
+
+from invenio_administration import schemas
+from invenio_administration.cli import compile_schemas
+from invenio_administration.schemas import (
+    SchemaArtifacts,
+    build_schema_document,
+    schema_fingerprint,
+)
+
+
+@pytest.fixture
+def artifacts(tmp_path, current_admin_core):
+    """Store the schema artifacts in a temporary directory."""
+    original = current_admin_core.schema_artifacts
+    current_admin_core.schema_artifacts = SchemaArtifacts(
+        str(tmp_path), fingerprint=lambda: "fingerprint"
+    )
+    current_admin_core.invalidate_schema_documents()
+    yield current_admin_core.schema_artifacts
+    current_admin_core.schema_artifacts = original
+    current_admin_core.invalidate_schema_documents()
+
+
+def test_schema_artifacts(tmp_path):
+    """Test writing and loading schema artifacts."""
+    document = build_schema_document({"resource_schema": {}, "actions": {}})
+    stale = tmp_path / f"mock.{'0' * 40}.json"
+    stale.write_text("{}")
+
+    artifacts = SchemaArtifacts(str(tmp_path), fingerprint=lambda: "a")
+    manifest = artifacts.write({"mock": document}, "en")
+    assert manifest["fingerprint"] == "a"
+    # artifacts of previous compilations are removed
+    assert not stale.exists()
+
+    artifacts = SchemaArtifacts(str(tmp_path), fingerprint=lambda: "a")
+    assert artifacts.load("mock", "en") == document
+    assert artifacts.load("mock", "de") is None
+    assert artifacts.load("unknown", "en") is None
+
+    # other package versions or serialization settings
+    outdated = SchemaArtifacts(str(tmp_path), fingerprint=lambda: "b")
+    assert outdated.load("mock", "en") is None
+
+    # missing artifact files
+    os.remove(tmp_path / manifest["views"]["mock"])
+    artifacts = SchemaArtifacts(str(tmp_path), fingerprint=lambda: "a")
+    assert artifacts.load("mock", "en") is None
+
+
+def test_compile_schemas(test_app, current_admin_core, artifacts):
+    """Test compiling the schemas and serving the compiled documents."""
+    result = test_app.test_cli_runner().invoke(compile_schemas)
+    assert result.exit_code == 0, result.output
+    filename = artifacts.manifest["views"][MockView.name]
+    assert f"{MockView.name}: {filename}" in result.output
+    assert "dashboard" not in artifacts.manifest["views"]
+
+    # mark the compiled document to check it is the one served
+    path = os.path.join(artifacts.path, filename)
+    with open(path, "w") as fp:
+        fp.write('{"compiled": true}')
+
+    with test_app.test_request_context():
+        document = current_admin_core.get_schema_document(MockView.name)
+    assert document.data == {"compiled": True}
+    assert document.etag == filename.rsplit(".", 2)[-2]
+
+
+def test_compiled_schemas_locale_mismatch(test_app, current_admin_core, artifacts):
+    """Test documents compiled with another locale are serialized live."""
+    with test_app.test_request_context():
+        live = current_admin_core.build_schema_document(MockView.name)
+    artifacts.write({MockView.name: build_schema_document({"compiled": True})}, "xx")
+
+    with test_app.test_request_context():
+        document = current_admin_core.get_schema_document(MockView.name)
+    assert document == live
+
+
+def test_compile_schemas_lazy_views(
+    create_app, app_config, tmp_path, mock_resource, mock_extension_name
+):
+    """Test the schemas of lazily added views are compiled."""
+    config = dict(
+        app_config,
+        ADMINISTRATION_ENTRY_POINTS_CACHE=str(tmp_path / "entry_points.json"),
+        ADMINISTRATION_LAZY_VIEWS=True,
+        ADMINISTRATION_SCHEMAS_ARTIFACTS_PATH=str(tmp_path / "schemas"),
+    )
+    # the first app caches the views' metadata
+    create_app(**config)
+    app = create_app(**config)
+    app.extensions[mock_extension_name] = SimpleNamespace(mocks=mock_resource)
+    admin = app.extensions["invenio-administration"].administration
+    assert MockView.name in admin._lazy_views
+
+    with app.app_context():
+        result = app.test_cli_runner().invoke(compile_schemas)
+    assert result.exit_code == 0, result.output
+    assert MockView.name in admin.schema_artifacts.manifest["views"]
+
+
+def test_schema_fingerprint(monkeypatch):
+    """Test the fingerprint follows the environment and the configuration."""
+    monkeypatch.setattr(schemas, "environment_fingerprint", lambda: "a")
+    fingerprint = schema_fingerprint({})
+    assert schema_fingerprint({}) == fingerprint
+    assert schema_fingerprint({"ADMINISTRATION_SCHEMA_REFS": True}) != fingerprint
+
+    monkeypatch.setattr(schemas, "environment_fingerprint", lambda: "b")
+    assert schema_fingerprint({}) != fingerprint